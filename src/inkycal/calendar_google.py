@@ -1,15 +1,20 @@
 from __future__ import annotations
 from datetime import datetime
-from typing import List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 import os
-
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+import tempfile
 
 from .models import Event
 
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+
+# The Google client libraries (googleapiclient pulls in httplib2, uritemplate
+# and the auth stack) take a noticeable share of a cold start on a Pi, and
+# most timer runs exit early (sleep window) without touching Google. They
+# are imported on first use instead of at module import.
+
 SCOPES = [
     "https://www.googleapis.com/auth/calendar.readonly",
     "https://www.googleapis.com/auth/tasks.readonly",
@@ -20,6 +25,13 @@ class GoogleAuthError(RuntimeError):
     """Raised when the Google token file is missing or cannot be refreshed."""
 
 
+def build(*args, **kwargs):
+    """googleapiclient.discovery.build, imported on first call."""
+    from googleapiclient.discovery import build as _build
+
+    return _build(*args, **kwargs)
+
+
 def _load_creds(token_path: str) -> Credentials:
     # The interactive OAuth flow runs off-device (scripts/google_auth.py) and
     # produces token_path. The Pi only reads that file and refreshes the
@@ -30,6 +42,9 @@ def _load_creds(token_path: str) -> Credentials:
             "Generate it off-device with scripts/google_auth.py and copy it here."
         )
 
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+
     creds = Credentials.from_authorized_user_file(token_path, SCOPES)
 
     if creds.valid:
@@ -50,8 +65,88 @@ def _persist_token(token_path: str, creds: Credentials) -> None:
     parent = os.path.dirname(token_path)
     if parent:
         os.makedirs(parent, exist_ok=True)
-    with open(token_path, "w", encoding="utf-8") as f:
-        f.write(creds.to_json())
+    # Calendar windows are fetched concurrently, so two threads may refresh
+    # and persist at the same moment. Write to a private temp file and
+    # rename over the token so neither can leave a torn file behind. Syncing
+    # before the rename keeps a power cut from leaving an empty token.
+    fd, tmp_path = tempfile.mkstemp(dir=parent or ".", prefix=".token-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(creds.to_json())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, token_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# Built calendar services keyed by token path, tagged with the token file's
+# mtime_ns when built. discovery.build parses a large discovery document, so a
+# long-lived process reuses the service until the token file is replaced; the
+# credentials inside refresh their access token on their own.
+_SERVICE_CACHE: Dict[str, Tuple[int, Any]] = {}
+
+
+def _calendar_service(token_path: str):
+    cached = _SERVICE_CACHE.get(token_path)
+    if cached is not None and cached[0] == _mtime_ns(token_path):
+        return cached[1]
+
+    creds = _load_creds(token_path)
+    service = build("calendar", "v3", credentials=creds, cache_discovery=False)
+    # Read the stamp after _load_creds, which rewrites the file on refresh.
+    stamp = _mtime_ns(token_path)
+    if stamp is not None:
+        _SERVICE_CACHE[token_path] = (stamp, service)
+    return service
+
+
+def _mtime_ns(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _parse_time(raw: str, all_day: bool, tz: ZoneInfo, cache: Dict[str, datetime]) -> datetime:
+    # Event boundaries repeat a lot (back-to-back meetings, all-day dates, the
+    # same event in several calendars), so each distinct string is parsed and
+    # localized once per fetch.
+    parsed = cache.get(raw)
+    if parsed is None:
+        parsed = datetime.fromisoformat(raw)
+        parsed = parsed.replace(tzinfo=tz) if all_day else parsed.astimezone(tz)
+        cache[raw] = parsed
+    return parsed
+
+
+def _parse_event(item: dict, tz: ZoneInfo, time_cache: Optional[Dict[str, datetime]] = None) -> Event:
+    if time_cache is None:
+        time_cache = {}
+    title = item.get("summary", "(No title)")
+    location = item.get("location")
+
+    start_obj = item.get("start", {})
+    end_obj = item.get("end", {})
+
+    all_day = "date" in start_obj
+    key = "date" if all_day else "dateTime"
+    start = _parse_time(start_obj[key], all_day, tz, time_cache)
+    end = _parse_time(end_obj[key], all_day, tz, time_cache)
+
+    return Event(
+        source="google",
+        title=title,
+        start=start,
+        end=end,
+        all_day=all_day,
+        location=location,
+        uid=item.get("iCalUID"),
+    )
 
 
 def fetch_google_events(
@@ -60,46 +155,171 @@ def fetch_google_events(
     day_end: datetime,
     tz: ZoneInfo,
     token_path: str,
+    service=None,
 ) -> List[Event]:
-    creds = _load_creds(token_path)
-    service = build("calendar", "v3", credentials=creds, cache_discovery=False)
+    return fetch_google_events_multi(
+        calendar_ids, [("range", day_start, day_end)], tz, token_path, service=service
+    )["range"]
 
-    events: List[Event] = []
-    time_min = day_start.isoformat()
-    time_max = day_end.isoformat()
 
+# Only the fields _parse_event reads are kept in the persisted sync cache, so
+# state.json stays small.
+_CACHED_ITEM_KEYS = ("id", "iCalUID", "summary", "location", "start", "end")
+
+# Partial response: just those fields, plus the status that marks
+# cancellations in incremental syncs and the paging/sync tokens. Google
+# otherwise returns descriptions, attendees, conference data, etc.
+_LIST_FIELDS = f"items({','.join(_CACHED_ITEM_KEYS)},status),nextPageToken,nextSyncToken"
+
+
+def _list_all(service, **kwargs) -> tuple[List[dict], str]:
+    """Run events.list across every page; return (items, nextSyncToken)."""
+    items: List[dict] = []
+    page_token = None
+    while True:
+        resp = service.events().list(pageToken=page_token, fields=_LIST_FIELDS, **kwargs).execute()
+        items.extend(resp.get("items", []))
+        page_token = resp.get("nextPageToken")
+        if not page_token:
+            return items, resp.get("nextSyncToken", "")
+
+
+def _full_sync(service, cal_id: str, time_min: str, time_max: str) -> tuple[List[dict], str]:
+    return _list_all(
+        service,
+        calendarId=cal_id,
+        timeMin=time_min,
+        timeMax=time_max,
+        singleEvents=True,
+    )
+
+
+def _synced_items(
+    service,
+    cal_id: str,
+    time_min: str,
+    time_max: str,
+    sync_cache: Dict[str, dict],
+) -> List[dict]:
+    """Return the calendar's items for [time_min, time_max] using a sync token.
+
+    ``sync_cache[cal_id]`` holds the last token, the window it was taken
+    over, and the items seen so far. When the requested window matches, only
+    the changes since that token are downloaded (usually none) and applied
+    to the cached items. A new window (e.g. after midnight), a missing
+    token, or an expired one (HTTP 410) falls back to a full listing.
+    """
+    from googleapiclient.errors import HttpError
+
+    entry = sync_cache.get(cal_id) or {}
+    if entry.get("token") and entry.get("time_min") == time_min and entry.get("time_max") == time_max:
+        try:
+            changes, token = _list_all(
+                service,
+                calendarId=cal_id,
+                syncToken=entry["token"],
+                singleEvents=True,
+            )
+        except HttpError as e:
+            if e.resp.status != 410:
+                raise
+            # Token expired server-side; start over with a full sync below.
+        else:
+            by_id = {item["id"]: item for item in entry.get("items", [])}
+            for item in changes:
+                if item.get("status") == "cancelled":
+                    by_id.pop(item.get("id"), None)
+                else:
+                    by_id[item["id"]] = {k: item[k] for k in _CACHED_ITEM_KEYS if k in item}
+            items = list(by_id.values())
+            _store_sync_entry(sync_cache, cal_id, token, time_min, time_max, items)
+            return items
+
+    items, token = _full_sync(service, cal_id, time_min, time_max)
+    items = [
+        {k: item[k] for k in _CACHED_ITEM_KEYS if k in item}
+        for item in items
+        if item.get("status") != "cancelled"
+    ]
+    _store_sync_entry(sync_cache, cal_id, token, time_min, time_max, items)
+    return items
+
+
+def _store_sync_entry(
+    sync_cache: Dict[str, dict],
+    cal_id: str,
+    token: str,
+    time_min: str,
+    time_max: str,
+    items: List[dict],
+) -> None:
+    if not token:
+        # Without a token there's nothing to resume from next time.
+        sync_cache.pop(cal_id, None)
+        return
+    sync_cache[cal_id] = {
+        "token": token,
+        "time_min": time_min,
+        "time_max": time_max,
+        "items": items,
+    }
+
+
+def fetch_google_events_multi(
+    calendar_ids: List[str],
+    windows: List[Tuple[str, datetime, datetime]],
+    tz: ZoneInfo,
+    token_path: str,
+    sync_cache: Optional[Dict[str, dict]] = None,
+    service=None,
+) -> Dict[str, List[Event]]:
+    """Fetch several (label, start, end) windows with one request per calendar.
+
+    Adjacent windows (today + tomorrow) would otherwise cost one
+    ``events.list`` round trip each. Instead each calendar is listed once
+    over the union of the windows and the results are split client-side,
+    using the same overlap rule the API applies to timeMin/timeMax, so an
+    event spanning midnight lands in both windows just as it would with
+    separate calls.
+
+    When ``sync_cache`` is given (a dict persisted by the caller between
+    runs), it is used to fetch only incremental changes via sync tokens;
+    see _synced_items. It is updated in place. ``service`` defaults to the
+    cached calendar service for ``token_path``.
+    """
+    results: Dict[str, List[Event]] = {label: [] for label, _, _ in windows}
+    if not windows:
+        return results
+
+    if service is None:
+        service = _calendar_service(token_path)
+
+    time_min = min(start for _, start, _ in windows).isoformat()
+    time_max = max(end for _, _, end in windows).isoformat()
+
+    if sync_cache is not None:
+        for cal_id in list(sync_cache):
+            if cal_id not in calendar_ids:
+                del sync_cache[cal_id]
+
+    time_cache: Dict[str, datetime] = {}
     for cal_id in calendar_ids:
-        resp = service.events().list(
-            calendarId=cal_id,
-            timeMin=time_min,
-            timeMax=time_max,
-            singleEvents=True,
-            orderBy="startTime",
-        ).execute()
-
-        for item in resp.get("items", []):
-            title = item.get("summary", "(No title)")
-            location = item.get("location")
-
-            start_obj = item.get("start", {})
-            end_obj = item.get("end", {})
-
-            if "date" in start_obj:
-                start = datetime.fromisoformat(start_obj["date"]).replace(tzinfo=tz)
-                end = datetime.fromisoformat(end_obj["date"]).replace(tzinfo=tz)
-                all_day = True
-            else:
-                start = datetime.fromisoformat(start_obj["dateTime"]).astimezone(tz)
-                end = datetime.fromisoformat(end_obj["dateTime"]).astimezone(tz)
-                all_day = False
-
-            events.append(Event(
-                source="google",
-                title=title,
-                start=start,
-                end=end,
-                all_day=all_day,
-                location=location,
-            ))
-
-    return events
+        if sync_cache is not None:
+            items = _synced_items(service, cal_id, time_min, time_max, sync_cache)
+        else:
+            items = service.events().list(
+                calendarId=cal_id,
+                timeMin=time_min,
+                timeMax=time_max,
+                singleEvents=True,
+                orderBy="startTime",
+                fields=_LIST_FIELDS,
+            ).execute().get("items", [])
+
+        for item in items:
+            event = _parse_event(item, tz, time_cache)
+            for label, window_start, window_end in windows:
+                if event.start < window_end and event.end > window_start:
+                    results[label].append(event)
+
+    return results
@@ -1,28 +1,115 @@
 from __future__ import annotations
 from datetime import datetime
+import functools
 import logging
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
-import caldav
-from caldav.elements import dav
-
 from .models import Event
 
+# caldav (with lxml, vobject and its recurrence stack) is imported inside the
+# functions that use it, so a run that never reaches iCloud (sleep window,
+# iCloud disabled) doesn't pay for it at startup.
+
 ICLOUD_CALDAV_URL = "https://caldav.icloud.com/"
 _ICAL_COMPAT_MSG = "Ical data was modified to avoid compatibility issues"
 
+# Discovered calendars per (username, app_password); see _icloud_calendars.
+_CALENDARS_CACHE: Dict[Tuple[str, str], list] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _getctag_element_class():
+    from caldav.elements.base import BaseElement
+
+    class _GetCTag(BaseElement):
+        # Calendar Server's collection tag; iCloud changes it on any edit to
+        # the calendar. caldav doesn't ship an element for it.
+        tag = "{http://calendarserver.org/ns/}getctag"
+
+    return _GetCTag
+
 
 class _IcalCompatibilityFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:
         return _ICAL_COMPAT_MSG not in record.getMessage()
 
 
+_FILTER_INSTALLED = False
+
+
 def _install_ical_compatibility_filter() -> None:
-    root_logger = logging.getLogger()
-    if any(isinstance(f, _IcalCompatibilityFilter) for f in root_logger.filters):
+    global _FILTER_INSTALLED
+    if _FILTER_INSTALLED:
         return
-    root_logger.addFilter(_IcalCompatibilityFilter())
+    logging.getLogger().addFilter(_IcalCompatibilityFilter())
+    _FILTER_INSTALLED = True
+
+def _to_local(value, tz: ZoneInfo) -> datetime:
+    """Convert a vobject date/datetime to an aware datetime in ``tz``."""
+    if not isinstance(value, datetime):
+        return datetime.combine(value, datetime.min.time(), tzinfo=tz)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=tz)
+    return value.astimezone(tz)
+
+def _icloud_calendars(username: str, app_password: str) -> list:
+    """Return the account's calendars, discovering them once per process.
+
+    Principal and calendar discovery are two extra PROPFIND round trips, and
+    the calendar set rarely changes, so the connected client and its
+    calendars are kept for the life of the process.
+    """
+    key = (username, app_password)
+    calendars = _CALENDARS_CACHE.get(key)
+    if calendars is None:
+        import caldav
+
+        client = caldav.DAVClient(
+            url=ICLOUD_CALDAV_URL,
+            username=username,
+            password=app_password,
+        )
+        calendars = client.principal().calendars()
+        _CALENDARS_CACHE[key] = calendars
+    return calendars
+
+
+def _parse_vevent(vevent, tz: ZoneInfo) -> Event:
+    # vevent.contents is the plain dict behind vobject's attribute access
+    # (name -> list of content lines); reading it directly skips the
+    # __getattr__ machinery for every field.
+    contents = vevent.contents
+    title = contents["summary"][0].value if "summary" in contents else "(No title)"
+    location = contents["location"][0].value if "location" in contents else None
+    uid = contents["uid"][0].value if "uid" in contents else None
+
+    dtstart = contents["dtstart"][0].value
+    dtend = contents["dtend"][0].value
+
+    # dtstart may be date (all-day) or datetime. Either way start/end
+    # come out in the display tz, like the Google fetcher's.
+    if isinstance(dtstart, datetime):
+        start = _to_local(dtstart, tz)
+        end = _to_local(dtend, tz)
+        all_day = False
+    else:
+        # date-only all-day event
+        start = datetime.combine(dtstart, datetime.min.time(), tzinfo=tz)
+        # dtend for all-day is usually the next day (exclusive)
+        end = _to_local(dtend, tz)
+        all_day = True
+
+    return Event(
+        source="icloud",
+        title=title,
+        start=start,
+        end=end,
+        all_day=all_day,
+        location=location,
+        uid=uid,
+    )
+
 
 def fetch_icloud_events(
     day_start: datetime,
@@ -32,61 +119,144 @@ def fetch_icloud_events(
     app_password: str,
     calendar_name_allowlist: List[str],
 ) -> List[Event]:
-    _install_ical_compatibility_filter()
+    return fetch_icloud_events_multi(
+        [("range", day_start, day_end)], tz, username, app_password, calendar_name_allowlist
+    )["range"]
 
-    client = caldav.DAVClient(
-        url=ICLOUD_CALDAV_URL,
-        username=username,
-        password=app_password,
-    )
-    principal = client.principal()
-    calendars = principal.calendars()
 
-    events: List[Event] = []
+def fetch_icloud_events_multi(
+    windows: List[Tuple[str, datetime, datetime]],
+    tz: ZoneInfo,
+    username: str,
+    app_password: str,
+    calendar_name_allowlist: List[str],
+    sync_cache: Optional[Dict[str, dict]] = None,
+) -> Dict[str, List[Event]]:
+    """Fetch several (label, start, end) windows with one search per calendar.
 
-    for cal in calendars:
-        name = getattr(cal, "name", None) or cal.get_properties([dav.DisplayName()]).get(dav.DisplayName(), "")
-        if calendar_name_allowlist and name not in calendar_name_allowlist:
-            continue
+    Mirrors calendar_google.fetch_google_events_multi: each calendar is
+    searched once over the union of the windows and every event is assigned
+    to each window it overlaps.
 
-        results = cal.date_search(day_start, day_end)
+    When ``sync_cache`` is given (a dict persisted by the caller between
+    runs), each calendar's CTag is checked first and, if it and the window
+    are unchanged, the events parsed last time are reused without running
+    the calendar query at all. It is updated in place.
+    """
+    _install_ical_compatibility_filter()
 
-        for r in results:
-            vobj = r.vobject_instance
-            vevent = getattr(vobj, "vevent", None)
-            if vevent is None:
-                continue
+    events: Dict[str, List[Event]] = {label: [] for label, _, _ in windows}
+    if not windows:
+        return events
 
-            title = str(getattr(vevent, "summary", None).value) if hasattr(vevent, "summary") else "(No title)"
-            location = str(getattr(vevent, "location", None).value) if hasattr(vevent, "location") else None
+    range_start = min(start for _, start, _ in windows)
+    range_end = max(end for _, _, end in windows)
 
-            dtstart = vevent.dtstart.value
-            dtend = vevent.dtend.value
+    from caldav.elements import dav
 
-            # dtstart may be date (all-day) or datetime
-            if isinstance(dtstart, datetime):
-                start = dtstart.astimezone(tz) if dtstart.tzinfo else dtstart.replace(tzinfo=tz)
-                end = dtend.astimezone(tz) if isinstance(dtend, datetime) and dtend.tzinfo else (
-                    dtend.replace(tzinfo=tz) if isinstance(dtend, datetime) else datetime.combine(dtend, datetime.min.time(), tzinfo=tz)
-                )
-                all_day = False
+    seen_urls = set()
+    try:
+        for cal in _icloud_calendars(username, app_password):
+            name = getattr(cal, "name", None) or cal.get_properties([dav.DisplayName()]).get(dav.DisplayName(), "")
+            if calendar_name_allowlist and name not in calendar_name_allowlist:
+                continue
+
+            if sync_cache is None:
+                cal_events = _search_calendar(cal, range_start, range_end, tz)
             else:
-                # date-only all-day event
-                start = datetime.combine(dtstart, datetime.min.time(), tzinfo=tz)
-                # dtend for all-day is usually the next day (exclusive)
-                if isinstance(dtend, datetime):
-                    end = dtend.replace(tzinfo=tz)
-                else:
-                    end = datetime.combine(dtend, datetime.min.time(), tzinfo=tz)
-                all_day = True
-
-            events.append(Event(
-                source="icloud",
-                title=title,
-                start=start,
-                end=end,
-                all_day=all_day,
-                location=location,
-            ))
+                url = str(cal.url)
+                seen_urls.add(url)
+                cal_events = _cached_search(cal, url, range_start, range_end, tz, sync_cache)
+
+            for event in cal_events:
+                for label, window_start, window_end in windows:
+                    if event.start < window_end and event.end > window_start:
+                        events[label].append(event)
+    except Exception:
+        # A calendar may have been deleted or the password revoked; rediscover
+        # next time instead of reusing a stale calendar list forever.
+        _CALENDARS_CACHE.pop((username, app_password), None)
+        raise
 
+    if sync_cache is not None:
+        for url in list(sync_cache):
+            if url not in seen_urls:
+                del sync_cache[url]
+
+    return events
+
+
+def _search_calendar(cal, range_start: datetime, range_end: datetime, tz: ZoneInfo) -> List[Event]:
+    # search() replaces date_search, which caldav deprecates. expand=True
+    # returns a recurring event's occurrences within the range, and search()
+    # splits them into one object each; every VEVENT in an object is still
+    # read, however the server groups them.
+    events: List[Event] = []
+    for r in cal.search(start=range_start, end=range_end, event=True, expand=True):
+        for vevent in r.vobject_instance.contents.get("vevent", []):
+            events.append(_parse_vevent(vevent, tz))
     return events
+
+
+def _cached_search(
+    cal,
+    url: str,
+    range_start: datetime,
+    range_end: datetime,
+    tz: ZoneInfo,
+    sync_cache: Dict[str, dict],
+) -> List[Event]:
+    """Search ``cal`` unless its CTag shows nothing changed since last time.
+
+    The CTag is a single cheap PROPFIND that changes whenever any object in
+    the calendar does, so comparing it avoids the calendar-query REPORT and
+    the vobject parsing of every result.
+    """
+    time_min = range_start.isoformat()
+    time_max = range_end.isoformat()
+    try:
+        ctag = cal.get_property(_getctag_element_class()())
+    except Exception:
+        ctag = None
+
+    entry = sync_cache.get(url) or {}
+    if ctag and entry.get("ctag") == ctag and entry.get("time_min") == time_min and entry.get("time_max") == time_max:
+        try:
+            return [_event_from_cache(item, tz) for item in entry.get("events", [])]
+        except (KeyError, TypeError, ValueError):
+            pass  # Malformed entry; fall through to a fresh search.
+
+    events = _search_calendar(cal, range_start, range_end, tz)
+    if ctag:
+        sync_cache[url] = {
+            "ctag": ctag,
+            "time_min": time_min,
+            "time_max": time_max,
+            "events": [_event_to_cache(e) for e in events],
+        }
+    else:
+        sync_cache.pop(url, None)
+    return events
+
+
+def _event_to_cache(event: Event) -> dict:
+    return {
+        "title": event.title,
+        "location": event.location,
+        "start": event.start.isoformat(),
+        "end": event.end.isoformat(),
+        "all_day": event.all_day,
+        "uid": event.uid,
+    }
+
+
+def _event_from_cache(item: dict, tz: ZoneInfo) -> Event:
+    return Event(
+        source="icloud",
+        title=item["title"],
+        start=datetime.fromisoformat(item["start"]).astimezone(tz),
+        end=datetime.fromisoformat(item["end"]).astimezone(tz),
+        all_day=bool(item["all_day"]),
+        location=item.get("location"),
+        uid=item.get("uid"),
+    )
@@ -1,23 +1,22 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-import yaml
+from typing import Any, Dict, List, Optional, Tuple
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SleepConfig:
     enabled: bool
     start: str
     end: str
     banner_text: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DeepCleanConfig:
     enabled: bool
     weekday: str
     time: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DisplayConfig:
     width: int
     height: int
@@ -25,30 +24,30 @@ class DisplayConfig:
     saturation: float
     border: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GoogleConfig:
     enabled: bool
     calendar_ids: List[str]
     tasks_enabled: bool = True
     task_list_allowlist: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ICloudConfig:
     enabled: bool
     calendar_name_allowlist: List[str]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TravelConfig:
     enabled: bool
     origin_address: str
     back_to_back_window_minutes: int
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WeatherConfig:
     latitude: float
     longitude: float
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AutoUpdateConfig:
     enabled: bool = True
     branch: str = "main"
@@ -57,7 +56,7 @@ class AutoUpdateConfig:
     # "anytime" (apply as soon as it is found).
     apply_window: str = "sleep"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ButtonsConfig:
     enabled: bool = True
     # BCM GPIO pin numbers for the Inky Impression's 4 built-in buttons
@@ -70,7 +69,7 @@ class ButtonsConfig:
     pin_update: int = 24   # D: force an OTA update check/apply
     bounce_time_ms: int = 300
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AppConfig:
     timezone: str
     poll_interval_minutes: int
@@ -84,9 +83,35 @@ class AppConfig:
     auto_update: AutoUpdateConfig = field(default_factory=AutoUpdateConfig)
     buttons: ButtonsConfig = field(default_factory=ButtonsConfig)
 
+# Parsed configs keyed by path, tagged with the file's (mtime_ns, size) when it
+# was read. Long-lived processes (the buttons daemon, repeated run_once calls)
+# skip the YAML parse entirely until config.yaml is actually edited. The
+# config dataclasses are frozen, so handing every caller the same instance
+# is safe.
+_CFG_CACHE: Dict[str, Tuple[Tuple[int, int], AppConfig]] = {}
+
+
 def load_config(path: str) -> AppConfig:
     p = Path(path)
-    data: Dict[str, Any] = yaml.safe_load(p.read_text(encoding="utf-8"))
+    st = p.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _CFG_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    cfg = _parse_config(p)
+    _CFG_CACHE[path] = (stamp, cfg)
+    return cfg
+
+
+def _parse_config(p: Path) -> AppConfig:
+    # Imported here so a cache hit never loads PyYAML at all.
+    import yaml
+
+    # libyaml's C loader is ~10x faster than the pure-Python one; fall back
+    # when PyYAML was built without it.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    data: Dict[str, Any] = yaml.load(p.read_text(encoding="utf-8"), Loader=loader)
 
     sleep = data.get("sleep", {})
     deep_clean = data.get("deep_clean", {})
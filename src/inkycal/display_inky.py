@@ -1,16 +1,29 @@
 from __future__ import annotations
 from PIL import Image
 
+# The detected display. Detection probes SPI/I2C and reads the board EEPROM,
+# and the hardware can't change while the process runs, so it's done once.
+_DISP = None
+
+
+def _display():
+    global _DISP
+    if _DISP is None:
+        from inky.auto import auto  # type: ignore
+
+        disp = auto(ask_user=False, verbose=False)
+        if disp is None:
+            raise RuntimeError("Could not auto-detect Inky display. Check wiring and SPI enabled.")
+        _DISP = disp
+    return _DISP
+
+
 def show_on_inky(img: Image.Image, rotate_degrees: int = 0, border: str = "white") -> None:
     """
     Displays a PIL image on Inky Impressions.
     Assumes the 'inky' library is installed on the Pi and hardware is connected.
     """
-    from inky.auto import auto  # type: ignore
-
-    disp = auto(ask_user=False, verbose=False)
-    if disp is None:
-        raise RuntimeError("Could not auto-detect Inky display. Check wiring and SPI enabled.")
+    disp = _display()
 
     if img.mode != "P":
         img = img.convert("P")
@@ -1,18 +1,20 @@
 from __future__ import annotations
 
+import functools
 import hashlib
-import json
 import os
 import re
 import unicodedata
-from datetime import datetime, time, timedelta
-from typing import List, Optional
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import asdict, replace
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 from dotenv import load_dotenv
 
-from .calendar_google import fetch_google_events
-from .calendar_icloud import fetch_icloud_events
+from .calendar_google import fetch_google_events, fetch_google_events_multi
+from .calendar_icloud import fetch_icloud_events, fetch_icloud_events_multi
 from .config import load_config
 from .display_inky import show_on_inky
 from .models import Event, Reminder
@@ -28,17 +30,18 @@ STATE_PATH_DEFAULT = "/var/lib/inkycal/state.json"
 CONFIG_PATH_DEFAULT = "/opt/inkycal/config.yaml"
 
 
-def _parse_hhmm(s: str) -> time:
-    hh, mm = s.split(":")
-    return time(hour=int(hh), minute=int(mm))
+def _parse_hhmm(s: str) -> int:
+    """Parse "HH:MM" into minutes since midnight."""
+    hh, mm = s.split(":", 1)
+    return int(hh) * 60 + int(mm)
 
 
-def _is_in_sleep_window(now: datetime, start: time, end: time) -> bool:
+def _is_in_sleep_window(now: datetime, start_minutes: int, end_minutes: int) -> bool:
     # Handles overnight windows (e.g., 22:30 -> 06:30)
-    t = now.timetz().replace(tzinfo=None)
-    if start < end:
-        return start <= t < end
-    return (t >= start) or (t < end)
+    t = now.hour * 60 + now.minute
+    if start_minutes < end_minutes:
+        return start_minutes <= t < end_minutes
+    return (t >= start_minutes) or (t < end_minutes)
 
 
 def _today_range(now: datetime, tz: ZoneInfo):
@@ -58,19 +61,26 @@ def _toggle_view_mode(current: str) -> str:
     return "weekly" if current != "weekly" else "daily"
 
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_NON_WORD_RE = re.compile(r"[^\w]", re.UNICODE)
+
+
 def _normalize_text(value: str | None) -> str:
     if not value:
         return ""
-    return " ".join(value.strip().lower().split())
+    return _WHITESPACE_RE.sub(" ", value.lower()).strip()
 
 
+# The same titles and locations come through for today, tomorrow and the
+# week view, so fingerprints are memoized for the life of the process.
+@functools.lru_cache(maxsize=4096)
 def _fingerprint_text(value: str | None) -> str:
     normalized = unicodedata.normalize("NFKC", _normalize_text(value)).casefold()
-    return re.sub(r"[^\w]", "", normalized, flags=re.UNICODE)
+    return _NON_WORD_RE.sub("", normalized)
 
 
-def _event_quality_score(event: Event) -> tuple[int, int]:
-    return (1 if _fingerprint_text(event.location) else 0, len(event.title.strip()))
+def _event_quality_score(event: Event, location_fingerprint: str) -> tuple[int, int]:
+    return (1 if location_fingerprint else 0, len(event.title.strip()))
 
 
 def _event_sort_key(e: Event):
@@ -79,68 +89,120 @@ def _event_sort_key(e: Event):
 
 def _dedupe_events(events: List[Event]) -> List[Event]:
     deduped: List[Event] = []
-    seen_by_base_key: dict[tuple[str, str, str, bool], list[int]] = {}
-
-    for e in sorted(events, key=_event_sort_key):
+    # Kept in step with `deduped` so each event is fingerprinted and scored
+    # once, not again every time a later candidate is compared against it.
+    deduped_location_fingerprints: List[str] = []
+    deduped_scores: List[tuple[int, int]] = []
+    deduped_base_keys: List[tuple[str, datetime, datetime, bool]] = []
+    # An event with no location matches anything sharing its base key, so a
+    # base key has either a single kept event with an empty location or
+    # kept events whose locations all differ. That makes both indexes O(1)
+    # lookups: the first kept event per base key, and kept events by
+    # (base key, location).
+    first_by_base_key: dict[tuple[str, datetime, datetime, bool], int] = {}
+    by_location: dict[tuple[tuple[str, datetime, datetime, bool], str], int] = {}
+    # The same invite seen through two calendars (or Google and iCloud)
+    # keeps its UID even when the copies' titles differ. Occurrences of a
+    # recurring event share one UID, so the start is part of the key.
+    by_uid: dict[tuple[str, datetime], int] = {}
+
+    # Datetimes are hashable and compare by instant, so they key directly
+    # without formatting; the kept list is sorted once at the end.
+    for e in events:
         base_key = (
             _fingerprint_text(e.title),
-            e.start.isoformat(),
-            e.end.isoformat(),
+            e.start,
+            e.end,
             bool(e.all_day),
         )
 
         location_fingerprint = _fingerprint_text(e.location)
-        duplicate_index: int | None = None
-        for idx in seen_by_base_key.get(base_key, []):
-            existing_location_fingerprint = _fingerprint_text(deduped[idx].location)
+        uid_key = (e.uid, e.start) if e.uid else None
+        duplicate_index = by_uid.get(uid_key) if uid_key else None
+        if duplicate_index is None:
+            duplicate_index = first_by_base_key.get(base_key)
             if (
-                location_fingerprint == existing_location_fingerprint
-                or not location_fingerprint
-                or not existing_location_fingerprint
+                duplicate_index is not None
+                and location_fingerprint
+                and deduped_location_fingerprints[duplicate_index]
             ):
-                duplicate_index = idx
-                break
+                duplicate_index = by_location.get((base_key, location_fingerprint))
 
+        score = _event_quality_score(e, location_fingerprint)
         if duplicate_index is not None:
-            if _event_quality_score(e) > _event_quality_score(deduped[duplicate_index]):
+            if uid_key:
+                by_uid.setdefault(uid_key, duplicate_index)
+            if score > deduped_scores[duplicate_index]:
                 deduped[duplicate_index] = e
+                deduped_location_fingerprints[duplicate_index] = location_fingerprint
+                deduped_scores[duplicate_index] = score
+                if location_fingerprint:
+                    by_location[(deduped_base_keys[duplicate_index], location_fingerprint)] = duplicate_index
             continue
 
-        seen_by_base_key.setdefault(base_key, []).append(len(deduped))
+        first_by_base_key.setdefault(base_key, len(deduped))
+        if location_fingerprint:
+            by_location[(base_key, location_fingerprint)] = len(deduped)
+        if uid_key:
+            by_uid[uid_key] = len(deduped)
         deduped.append(e)
+        deduped_location_fingerprints.append(location_fingerprint)
+        deduped_scores.append(score)
+        deduped_base_keys.append(base_key)
 
+    deduped.sort(key=_event_sort_key)
     return deduped
 
 
 def _merge_all_day_events(events: List[Event]) -> List[Event]:
-    all_day_events = [e for e in events if e.all_day]
-    timed_events = [e for e in events if not e.all_day]
-    if not all_day_events:
-        return sorted(timed_events, key=_event_sort_key)
-
-    sorted_titles = [e.title.strip() for e in all_day_events if e.title.strip()]
-    sorted_titles.sort(key=str.lower)
-    if sorted_titles:
-        summary_title = "All-day: " + " • ".join(sorted_titles)
+    timed_events: List[Event] = []
+    titles: List[str] = []
+    merged_start: datetime | None = None
+    merged_end: datetime | None = None
+    for e in events:
+        if not e.all_day:
+            timed_events.append(e)
+            continue
+        title = e.title.strip()
+        if title:
+            titles.append(title)
+        if merged_start is None or e.start < merged_start:
+            merged_start = e.start
+        if merged_end is None or e.end > merged_end:
+            merged_end = e.end
+
+    timed_events.sort(key=_event_sort_key)
+    if merged_start is None:
+        return timed_events
+
+    titles.sort(key=str.lower)
+    if titles:
+        summary_title = "All-day: " + " • ".join(titles)
     else:
         summary_title = "All-day events"
 
     merged = Event(
         source="merged",
         title=summary_title,
-        start=min(e.start for e in all_day_events),
-        end=max(e.end for e in all_day_events),
+        start=merged_start,
+        end=merged_end,
         all_day=True,
     )
 
-    return [merged, *sorted(timed_events, key=_event_sort_key)]
+    return [merged, *timed_events]
 
 
-def _apply_travel_times(events: List[Event], origin_address: str, back_to_back_window_minutes: int) -> List[Event]:
+def _apply_travel_times(
+    events: List[Event],
+    origin_address: str,
+    back_to_back_window_minutes: int,
+    resolver: Optional[TravelTimeResolver] = None,
+) -> List[Event]:
     if not origin_address:
         return events
 
-    resolver = TravelTimeResolver()
+    if resolver is None:
+        resolver = TravelTimeResolver()
     processed: List[Event] = []
     previous_timed_event: Event | None = None
     for event in events:
@@ -160,17 +222,7 @@ def _apply_travel_times(events: List[Event], origin_address: str, back_to_back_w
             if estimate:
                 travel_text = f"Travel: {estimate.text}"
 
-        processed.append(
-            Event(
-                source=event.source,
-                title=event.title,
-                start=event.start,
-                end=event.end,
-                all_day=event.all_day,
-                location=event.location,
-                travel_time_text=travel_text,
-            )
-        )
+        processed.append(replace(event, travel_time_text=travel_text))
         previous_timed_event = event
 
     return processed
@@ -180,12 +232,9 @@ def _apply_travel_times(events: List[Event], origin_address: str, back_to_back_w
 
 def _apply_weather_forecast(
     events: List[Event],
-    timezone: str,
-    latitude: float,
-    longitude: float,
+    resolver: WeatherForecastResolver,
     include_end_weather_for_long_events: bool = True,
 ) -> List[Event]:
-    resolver = WeatherForecastResolver(timezone=timezone, latitude=latitude, longitude=longitude)
     processed: List[Event] = []
     for event in events:
         if event.all_day:
@@ -221,14 +270,8 @@ def _apply_weather_forecast(
                 weather_end_temperature_f = end_weather.temperature_f
 
         processed.append(
-            Event(
-                source=event.source,
-                title=event.title,
-                start=event.start,
-                end=event.end,
-                all_day=event.all_day,
-                location=event.location,
-                travel_time_text=event.travel_time_text,
+            replace(
+                event,
                 weather_icon=weather_icon,
                 weather_text=weather_text,
                 weather_temperature_f=weather_temperature_f,
@@ -239,56 +282,167 @@ def _apply_weather_forecast(
         )
     return processed
 
-def _process_events(events: List[Event], travel_enabled: bool, origin_address: str, back_to_back_window_minutes: int) -> List[Event]:
+def _process_events(
+    events: List[Event],
+    travel_enabled: bool,
+    origin_address: str,
+    back_to_back_window_minutes: int,
+    travel_resolver: Optional[TravelTimeResolver] = None,
+) -> List[Event]:
     processed = _dedupe_events(events)
     processed = _merge_all_day_events(processed)
     if travel_enabled:
-        processed = _apply_travel_times(processed, origin_address, back_to_back_window_minutes)
+        processed = _apply_travel_times(processed, origin_address, back_to_back_window_minutes, travel_resolver)
     return processed
 
 
-def _fetch_raw_events(cfg, range_start: datetime, range_end: datetime, tz: ZoneInfo) -> List[Event]:
-    events: List[Event] = []
+def _fetch_google_raw(
+    cfg,
+    windows: List[Tuple[str, datetime, datetime]],
+    tz: ZoneInfo,
+    google_sync: Optional[Dict[str, dict]] = None,
+) -> Dict[str, List[Event]]:
+    token_path = os.environ.get("GOOGLE_TOKEN_JSON", "")
+    try:
+        if len(windows) == 1 and google_sync is None:
+            label, range_start, range_end = windows[0]
+            return {label: fetch_google_events(cfg.google.calendar_ids, range_start, range_end, tz, token_path)}
+        # One events.list per calendar covers every window (today + tomorrow).
+        return fetch_google_events_multi(
+            cfg.google.calendar_ids, windows, tz, token_path, sync_cache=google_sync
+        )
+    except Exception as e:
+        print(f"Google Calendar fetch failed; continuing without Google events. Error: {e}")
+        return {}
+
+
+def _fetch_icloud_raw(
+    cfg,
+    windows: List[Tuple[str, datetime, datetime]],
+    tz: ZoneInfo,
+    icloud_sync: Optional[Dict[str, dict]] = None,
+) -> Dict[str, List[Event]]:
+    try:
+        user = os.environ.get("ICLOUD_USERNAME", "")
+        pw = os.environ.get("ICLOUD_APP_PASSWORD", "")
+        allowlist = cfg.icloud.calendar_name_allowlist
+        if len(windows) == 1 and icloud_sync is None:
+            label, range_start, range_end = windows[0]
+            return {label: fetch_icloud_events(range_start, range_end, tz, user, pw, allowlist)}
+        # One calendar search covers every window (today + tomorrow).
+        return fetch_icloud_events_multi(windows, tz, user, pw, allowlist, sync_cache=icloud_sync)
+    except Exception as e:
+        print(f"iCloud fetch failed; continuing without iCloud. Error: {e}")
+        return {}
+
+
+def _fetch_raw_events_multi(
+    cfg,
+    windows: List[Tuple[str, datetime, datetime]],
+    tz: ZoneInfo,
+    google_sync: Optional[Dict[str, dict]] = None,
+    icloud_sync: Optional[Dict[str, dict]] = None,
+    executor: Optional[Executor] = None,
+) -> Dict[str, List[Event]]:
+    """Fetch every (label, start, end) window from each enabled source.
+
+    Google and iCloud are independent IO-bound round trips, so they run
+    concurrently and the total wait is roughly the slower one rather than
+    the sum. Each source covers all windows in a single task
+    (one listing per calendar, split client-side). Results are merged back
+    in a fixed (Google, then iCloud) order per window so the output doesn't
+    depend on which finished first.
+
+    Sources are submitted to `executor` when one is given (run_once shares
+    its pool), otherwise to a pool that lasts for this call.
+    """
+    sources = []
     if cfg.google.enabled:
-        token_path = os.environ.get("GOOGLE_TOKEN_JSON", "")
-        if token_path:
-            try:
-                events.extend(fetch_google_events(cfg.google.calendar_ids, range_start, range_end, tz, token_path))
-            except Exception as e:
-                print(f"Google Calendar fetch failed; continuing without Google events. Error: {e}")
+        if os.environ.get("GOOGLE_TOKEN_JSON", ""):
+            sources.append((_fetch_google_raw, (cfg, windows, tz, google_sync)))
         else:
             print("Google enabled but GOOGLE_TOKEN_JSON not set; skipping Google. Generate it off-device with scripts/google_auth.py.")
 
     if cfg.icloud.enabled:
-        try:
-            user = os.environ.get("ICLOUD_USERNAME", "")
-            pw = os.environ.get("ICLOUD_APP_PASSWORD", "")
-            if user and pw:
-                events.extend(fetch_icloud_events(range_start, range_end, tz, user, pw, cfg.icloud.calendar_name_allowlist))
-            else:
-                print("iCloud enabled but ICLOUD_USERNAME/ICLOUD_APP_PASSWORD not set; skipping iCloud.")
-        except Exception as e:
-            print(f"iCloud fetch failed; continuing without iCloud. Error: {e}")
+        if os.environ.get("ICLOUD_USERNAME", "") and os.environ.get("ICLOUD_APP_PASSWORD", ""):
+            sources.append((_fetch_icloud_raw, (cfg, windows, tz, icloud_sync)))
+        else:
+            print("iCloud enabled but ICLOUD_USERNAME/ICLOUD_APP_PASSWORD not set; skipping iCloud.")
 
-    return events
+    results: Dict[str, List[Event]] = {label: [] for label, _, _ in windows}
+    if not windows or not sources:
+        return results
 
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=len(sources)) as ex:
+            return _fetch_raw_events_multi(cfg, windows, tz, google_sync, icloud_sync, executor=ex)
 
-def _fetch_events_for_range(cfg, range_start: datetime, range_end: datetime, tz: ZoneInfo) -> List[Event]:
-    events = _fetch_raw_events(cfg, range_start, range_end, tz)
+    futures = [executor.submit(fetch, *args) for fetch, args in sources]
+    for future in futures:
+        for label, events in future.result().items():
+            results[label].extend(events)
+
+    return results
+
+
+def _fetch_raw_events(
+    cfg,
+    range_start: datetime,
+    range_end: datetime,
+    tz: ZoneInfo,
+    executor: Optional[Executor] = None,
+) -> List[Event]:
+    return _fetch_raw_events_multi(cfg, [("range", range_start, range_end)], tz, executor=executor)["range"]
+
+
+def _process_events_for_cfg(
+    cfg,
+    events: List[Event],
+    travel_resolver: Optional[TravelTimeResolver] = None,
+) -> List[Event]:
     return _process_events(
         events,
         travel_enabled=cfg.travel.enabled,
         origin_address=cfg.travel.origin_address,
         back_to_back_window_minutes=cfg.travel.back_to_back_window_minutes,
+        travel_resolver=travel_resolver,
     )
 
 
-def _fetch_events_for_week(cfg, range_start: datetime, range_end: datetime, tz: ZoneInfo) -> List[Event]:
+def _fetch_events_for_range(cfg, range_start: datetime, range_end: datetime, tz: ZoneInfo) -> List[Event]:
+    events = _fetch_raw_events(cfg, range_start, range_end, tz)
+    return _process_events_for_cfg(cfg, events)
+
+
+def _fetch_events_for_days(
+    cfg,
+    windows: List[Tuple[str, datetime, datetime]],
+    tz: ZoneInfo,
+    google_sync: Optional[Dict[str, dict]] = None,
+    icloud_sync: Optional[Dict[str, dict]] = None,
+    travel_resolver: Optional[TravelTimeResolver] = None,
+    executor: Optional[Executor] = None,
+) -> Dict[str, List[Event]]:
+    raw = _fetch_raw_events_multi(cfg, windows, tz, google_sync, icloud_sync, executor)
+    if travel_resolver is None and cfg.travel.enabled:
+        # One resolver for every window, so a trip shared by today and
+        # tomorrow is only looked up once.
+        travel_resolver = TravelTimeResolver()
+    return {label: _process_events_for_cfg(cfg, events, travel_resolver) for label, events in raw.items()}
+
+
+def _fetch_events_for_week(
+    cfg,
+    range_start: datetime,
+    range_end: datetime,
+    tz: ZoneInfo,
+    executor: Optional[Executor] = None,
+) -> List[Event]:
     # Weekly view only shows event names grouped by day, so this skips the
     # travel-time and all-day-merge processing that _fetch_events_for_range
     # applies for the daily view (merging would collapse all-day events from
     # different days into a single row).
-    events = _fetch_raw_events(cfg, range_start, range_end, tz)
+    events = _fetch_raw_events(cfg, range_start, range_end, tz, executor)
     return _dedupe_events(events)
 
 
@@ -314,6 +468,14 @@ def _fetch_reminders_for_day(cfg, day_end: datetime, tz: ZoneInfo) -> List[Remin
     return sorted(reminders, key=_reminder_sort_key)
 
 
+def _fetch_weather_alerts(resolver: WeatherForecastResolver) -> List[WeatherAlert]:
+    try:
+        return resolver.active_alerts()
+    except Exception as e:
+        print(f"NWS alert lookup failed; continuing without alerts. Error: {e}")
+        return []
+
+
 def print_long_events_weather_report(config_path: str = CONFIG_PATH_DEFAULT) -> None:
     load_dotenv()
     cfg = load_config(config_path)
@@ -367,47 +529,71 @@ def _events_signature(
     view_mode: str = "daily",
     week_events: Optional[List[Event]] = None,
 ) -> str:
-    # Only include fields that affect rendering.
-    def _event_payload(e: Event) -> dict:
-        return {
-            "source": e.source,
-            "title": e.title,
-            "start": e.start.astimezone(tz).isoformat(),
-            "end": e.end.astimezone(tz).isoformat(),
-            "all_day": e.all_day,
-            "location": e.location or "",
-            "travel_time_text": e.travel_time_text or "",
-        }
-
-    def _reminder_payload(r: Reminder) -> dict:
-        return {
-            "source": r.source,
-            "title": r.title,
-            "due": r.due.astimezone(tz).isoformat() if r.due else "",
-            "overdue": r.overdue,
-        }
-
-    ups_payload = {
-        "present": ups_status.get("present", False),
-        "status": ups_status.get("status", ""),
-        "capacity": ups_status.get("capacity"),
-        "online": ups_status.get("online"),
-    }
-    payload = {
-        "header_date": header_date,
-        "sleep_banner": sleep_banner,
-        "wifi_status": wifi_status,
-        "ups_status": ups_payload,
-        "events": [_event_payload(e) for e in events],
-        "tomorrow_events": [_event_payload(e) for e in tomorrow_events],
-        "weather_alerts": [a.headline for a in weather_alerts],
-        "reminders": [_reminder_payload(r) for r in (reminders or [])],
-        "update_pending": update_pending,
-        "view_mode": view_mode,
-        "week_events": [_event_payload(e) for e in (week_events or [])],
-    }
-    b = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
-    return hashlib.sha256(b).hexdigest()
+    # Only include fields that affect rendering. Fields are streamed straight
+    # into the hash (no intermediate dict/JSON): \x1f ends a field, \x1e ends
+    # a record, and each section is tagged so e.g. moving an event from today
+    # to tomorrow still changes the digest.
+    h = hashlib.blake2b(digest_size=16)
+
+    def _field(value) -> None:
+        h.update(str(value).encode("utf-8"))
+        h.update(b"\x1f")
+
+    def _section(name: str, count: int) -> None:
+        h.update(b"\x1e")
+        _field(name)
+        _field(count)
+
+    def _event_fields(e: Event) -> None:
+        # Epoch seconds pin the instant; the timezone key (hashed once
+        # below) covers how it is displayed.
+        _field(e.source)
+        _field(e.title)
+        _field(int(e.start.timestamp()))
+        _field(int(e.end.timestamp()))
+        _field(1 if e.all_day else 0)
+        _field(e.location or "")
+        _field(e.travel_time_text or "")
+        h.update(b"\x1e")
+
+    _field(getattr(tz, "key", str(tz)))
+    _field(header_date)
+    _field(1 if sleep_banner else 0)
+    _field(wifi_status)
+    _field(ups_status.get("present", False))
+    _field(ups_status.get("status", ""))
+    _field(ups_status.get("capacity"))
+    _field(ups_status.get("online"))
+    _field(1 if update_pending else 0)
+    _field(view_mode)
+
+    _section("events", len(events))
+    for e in events:
+        _event_fields(e)
+
+    _section("tomorrow_events", len(tomorrow_events))
+    for e in tomorrow_events:
+        _event_fields(e)
+
+    _section("weather_alerts", len(weather_alerts))
+    for a in weather_alerts:
+        _field(a.headline)
+
+    reminders = reminders or []
+    _section("reminders", len(reminders))
+    for r in reminders:
+        _field(r.source)
+        _field(r.title)
+        _field(int(r.due.timestamp()) if r.due else "")
+        _field(1 if r.overdue else 0)
+        h.update(b"\x1e")
+
+    week_events = week_events or []
+    _section("week_events", len(week_events))
+    for e in week_events:
+        _event_fields(e)
+
+    return h.hexdigest()
 
 
 def run_once(
@@ -473,12 +659,8 @@ def run_once(
         timezone=cfg.timezone,
         latitude=cfg.weather.latitude,
         longitude=cfg.weather.longitude,
+        cache=state.weather_cache,
     )
-    try:
-        weather_alerts = weather_resolver.active_alerts()
-    except Exception as e:
-        print(f"NWS alert lookup failed; continuing without alerts. Error: {e}")
-        weather_alerts = []
 
     header_date = now.strftime("%A, %B %-d, %Y")
     show_banner = in_sleep and cfg.sleep.enabled
@@ -490,15 +672,38 @@ def run_once(
     reminders: List[Reminder] = []
     week_events: List[Event] = []
 
-    if view_mode == "weekly":
-        week_start, week_end = _week_range(now, tz)
-        week_events = _fetch_events_for_week(cfg, week_start, week_end, tz)
-    else:
-        tomorrow_start = day_start + timedelta(days=1)
-        tomorrow_end = day_end + timedelta(days=1)
-        events = _fetch_events_for_range(cfg, day_start, day_end, tz)
-        tomorrow_events = _fetch_events_for_range(cfg, tomorrow_start, tomorrow_end, tz)
-        reminders = _fetch_reminders_for_day(cfg, day_end, tz)
+    # Fetching refreshes caches kept in the state file (sync tokens, CTags,
+    # travel lookups); snapshot it to tell whether it needs saving on the no-redraw path.
+    state_before = asdict(state)
+    # One pool for every network call in the run: the NWS alert lookup and
+    # the Google Tasks fetch don't depend on the calendars, so they run
+    # alongside the Google and iCloud fetches. Four workers cover all of
+    # them at once.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        alerts_future = pool.submit(_fetch_weather_alerts, weather_resolver)
+        if view_mode == "weekly":
+            week_start, week_end = _week_range(now, tz)
+            week_events = _fetch_events_for_week(cfg, week_start, week_end, tz, executor=pool)
+        else:
+            reminders_future = pool.submit(_fetch_reminders_for_day, cfg, day_end, tz)
+            travel_resolver = TravelTimeResolver(cache=state.travel_cache) if cfg.travel.enabled else None
+            tomorrow_start = day_start + timedelta(days=1)
+            tomorrow_end = day_end + timedelta(days=1)
+            by_day = _fetch_events_for_days(
+                cfg,
+                [("today", day_start, day_end), ("tomorrow", tomorrow_start, tomorrow_end)],
+                tz,
+                google_sync=state.google_sync,
+                icloud_sync=state.icloud_sync,
+                travel_resolver=travel_resolver,
+                executor=pool,
+            )
+            events = by_day["today"]
+            tomorrow_events = by_day["tomorrow"]
+            if travel_resolver is not None:
+                state.travel_cache = travel_resolver.cache_snapshot()
+            reminders = reminders_future.result()
+        weather_alerts = alerts_future.result()
 
     # Render signature includes whether we show the sleep banner
     sig = _events_signature(
@@ -522,6 +727,9 @@ def run_once(
         and (sig == state.last_hash)
     ):
         print("No schedule change; skipping display refresh")
+        if asdict(state) != state_before:
+            # Keep the refreshed caches even though nothing is redrawn.
+            save_state(state_path, state)
         return
 
     if view_mode == "weekly":
@@ -539,17 +747,12 @@ def run_once(
             update_pending=update_pending,
         )
     else:
-        events_with_weather = _apply_weather_forecast(
-            events,
-            cfg.timezone,
-            cfg.weather.latitude,
-            cfg.weather.longitude,
-        )
+        # One resolver serves the alerts and both days, so they all share
+        # its single forecast download.
+        events_with_weather = _apply_weather_forecast(events, weather_resolver)
         tomorrow_events_with_weather = _apply_weather_forecast(
             tomorrow_events,
-            cfg.timezone,
-            cfg.weather.latitude,
-            cfg.weather.longitude,
+            weather_resolver,
             include_end_weather_for_long_events=False,
         )
 
@@ -567,10 +770,13 @@ def run_once(
             weather_alerts=weather_alerts,
             reminders=reminders,
             update_pending=update_pending,
+            # Dedupe/all-day merge already ordered both lists for display.
+            events_presorted=True,
         )
 
     show_on_inky(img, rotate_degrees=cfg.display.rotate_degrees, border=cfg.display.border)
 
+    state.weather_cache = weather_resolver.cache_snapshot()
     state.last_hash = sig
     state.last_rendered_iso = now.isoformat()
     if should_apply_sleep_banner:
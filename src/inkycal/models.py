@@ -3,12 +3,12 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class Event:
     source: str                 # "google" / "icloud"
     title: str
-    start: datetime             # timezone-aware
-    end: datetime               # timezone-aware
+    start: datetime             # timezone-aware, in the configured display tz
+    end: datetime               # timezone-aware, in the configured display tz
     all_day: bool = False
     location: Optional[str] = None
     travel_time_text: Optional[str] = None
@@ -18,9 +18,10 @@ class Event:
     weather_end_icon: Optional[str] = None
     weather_end_text: Optional[str] = None
     weather_end_temperature_f: Optional[int] = None
+    uid: Optional[str] = None   # iCalendar UID (Google iCalUID); shared by every occurrence
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class Reminder:
     source: str                 # "google" (Google Tasks)
     title: str
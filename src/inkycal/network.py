@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -8,22 +9,40 @@ POWER_SUPPLY_PATH = Path("/sys/class/power_supply")
 
 
 def _read_text(path: Path) -> str:
+    # sysfs attributes are at most a page long, so a single read() returns
+    # the whole value without going through a buffered text file object.
     try:
-        return path.read_text(encoding="utf-8").strip()
+        fd = os.open(path, os.O_RDONLY)
     except OSError:
         return ""
+    try:
+        return os.read(fd, 4096).decode("utf-8", "replace").strip()
+    except OSError:
+        return ""
+    finally:
+        os.close(fd)
+
+
+def _subdirectories(path: Path) -> list[Path]:
+    """Directories directly under path, sorted by name.
+
+    The /sys/class entries are symlinks into /sys/devices, so is_dir()
+    must follow them.
+    """
+    with os.scandir(path) as it:
+        entries = [entry for entry in it if entry.is_dir()]
+    entries.sort(key=lambda entry: entry.name)
+    return [Path(entry.path) for entry in entries]
 
 
 def get_wifi_status(sys_net_path: Path = SYS_NET_PATH) -> str:
     """Return wifi status as connected/disconnected/empty if no wifi interface."""
     try:
-        interfaces = sorted(sys_net_path.iterdir())
+        interfaces = _subdirectories(sys_net_path)
     except OSError:
         return ""
 
     for iface in interfaces:
-        if not iface.is_dir():
-            continue
         if not (iface / "wireless").is_dir():
             continue
 
@@ -65,13 +84,11 @@ def _read_optional_bool(value: str) -> Optional[bool]:
 def get_ups_status(power_supply_path: Path = POWER_SUPPLY_PATH) -> dict:
     """Return UPS status info from /sys/class/power_supply, or present=False."""
     try:
-        supplies = sorted(power_supply_path.iterdir())
+        supplies = _subdirectories(power_supply_path)
     except OSError:
         return {"present": False, "status": "", "capacity": None, "online": None}
 
     for supply in supplies:
-        if not supply.is_dir():
-            continue
         if _read_text(supply / "type").upper() != "UPS":
             continue
 
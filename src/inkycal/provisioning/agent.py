@@ -19,18 +19,13 @@ import time
 
 from . import wifi
 from .ble import BleProvisioner
-from .httpserver import info_payload, serve
+from .httpserver import device_id, info_payload, serve
 from .mdns import MdnsAdvertiser
 from .protocol import HTTP_PORT
 
 
-def _device_id() -> str:
-    return info_payload().get("id", "pi")
-
-
 def run() -> int:
     print("== InkyCal provisioning agent ==")
-    device_id = _device_id()
 
     # WiFi/HTTP transport is cheap to always run.
     serve(HTTP_PORT)
@@ -40,7 +35,7 @@ def run() -> int:
     ble.start()
 
     # mDNS advertisement follows WiFi connectivity.
-    mdns = MdnsAdvertiser(port=HTTP_PORT, device_id=device_id)
+    mdns = MdnsAdvertiser(port=HTTP_PORT, device_id=device_id())
     advertised_ip: str | None = None
 
     stop = threading.Event()
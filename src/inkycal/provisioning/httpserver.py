@@ -12,6 +12,7 @@ pairing token (INKYCAL_PAIR_TOKEN) gates the write endpoints when set.
 """
 from __future__ import annotations
 
+import functools
 import json
 import os
 import socket
@@ -25,8 +26,13 @@ from .protocol import HTTP_PORT
 MAX_BODY_BYTES = 64 * 1024
 
 
-def _device_id() -> str:
-    """Stable-ish identifier derived from the machine-id / hostname."""
+@functools.lru_cache(maxsize=None)
+def device_id() -> str:
+    """Stable-ish identifier derived from the machine-id / hostname.
+
+    Read once per process: it is served on every /info request and doesn't
+    change while the agent runs.
+    """
     for path in ("/etc/machine-id", "/var/lib/dbus/machine-id"):
         try:
             with open(path, encoding="utf-8") as f:
@@ -46,7 +52,7 @@ def info_payload() -> dict:
     st = wifi.status()
     return {
         "device": "inkycal",
-        "id": _device_id(),
+        "id": device_id(),
         "hostname": st["hostname"],
         "wifi": "connected" if st["connected"] else "disconnected",
         "ssid": st["ssid"],
@@ -63,7 +69,7 @@ class _Handler(BaseHTTPRequestHandler):
         print("[http] " + (fmt % args))
 
     def _send_json(self, code: int, payload: dict) -> None:
-        body = json.dumps(payload).encode("utf-8")
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
         self.send_response(code)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(body)))
@@ -60,11 +60,15 @@ def save_token(raw: bytes | str, path: Optional[str] = None) -> str:
     parent = os.path.dirname(dest) or "."
     os.makedirs(parent, exist_ok=True)
 
-    # Atomic write: temp file in the same dir, then rename.
+    # Atomic write: temp file in the same dir, then rename. The data is
+    # fsynced before the rename so a power cut (the Pi has no clean
+    # shutdown) can't leave an empty token behind the new name.
     fd, tmp = tempfile.mkstemp(dir=parent, prefix=".google_token.", suffix=".tmp")
     try:
         with os.fdopen(fd, "w", encoding="utf-8") as f:
             json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
         os.replace(tmp, dest)
     finally:
         if os.path.exists(tmp):
@@ -6,6 +6,7 @@ or a failed command, they return structured results the caller can act on.
 """
 from __future__ import annotations
 
+import re
 import shutil
 import socket
 import subprocess
@@ -19,8 +20,21 @@ class WifiStatus(TypedDict):
     hostname: str
 
 
-def _nmcli_available() -> bool:
-    return shutil.which("nmcli") is not None
+# Absolute path to nmcli, resolved on first use. The agent checks WiFi
+# every 15s, so this saves a $PATH walk per poll. Only a successful lookup
+# is kept, so installing NetworkManager later still gets picked up.
+_NMCLI: Optional[str] = None
+
+
+def _nmcli() -> Optional[str]:
+    global _NMCLI
+    if _NMCLI is None:
+        _NMCLI = shutil.which("nmcli")
+    return _NMCLI
+
+
+# First "yes:<ssid>" line of `nmcli -t -f ACTIVE,SSID device wifi list`.
+_ACTIVE_SSID_RE = re.compile(r"^yes:(.+)$", re.MULTILINE)
 
 
 def _run(cmd: list[str], timeout: int = 45) -> subprocess.CompletedProcess:
@@ -34,18 +48,22 @@ def _run(cmd: list[str], timeout: int = 45) -> subprocess.CompletedProcess:
 
 
 def current_ssid() -> Optional[str]:
-    if not _nmcli_available():
+    nmcli = _nmcli()
+    if not nmcli:
         return None
+    # --rescan no: listing otherwise triggers a WiFi scan whenever the
+    # cached results are over 30s old (i.e. on nearly every poll), and the
+    # associated AP is always in the cached list anyway.
     try:
-        proc = _run(["nmcli", "-t", "-f", "ACTIVE,SSID", "device", "wifi"], timeout=10)
+        proc = _run(
+            [nmcli, "-t", "-f", "ACTIVE,SSID", "device", "wifi", "list", "--rescan", "no"],
+            timeout=10,
+        )
     except (OSError, subprocess.SubprocessError):
         return None
-    for line in proc.stdout.splitlines():
-        # Format: "yes:MyNetwork" or "no:OtherNetwork"
-        active, _, ssid = line.partition(":")
-        if active == "yes" and ssid:
-            return ssid
-    return None
+    # Lines look like "yes:MyNetwork" or "no:OtherNetwork".
+    match = _ACTIVE_SSID_RE.search(proc.stdout)
+    return match.group(1) if match else None
 
 
 def primary_ip() -> Optional[str]:
@@ -79,10 +97,11 @@ def configure_wifi(ssid: str, psk: str, timeout: int = 60) -> tuple[bool, str]:
     ssid = (ssid or "").strip()
     if not ssid:
         return False, "Empty SSID"
-    if not _nmcli_available():
+    nmcli = _nmcli()
+    if not nmcli:
         return False, "nmcli not available on this device"
 
-    cmd = ["nmcli", "device", "wifi", "connect", ssid]
+    cmd = [nmcli, "device", "wifi", "connect", ssid]
     if psk:
         cmd += ["password", psk]
     try:
@@ -3,9 +3,7 @@ from datetime import datetime, timedelta
 from typing import List, Optional
 from zoneinfo import ZoneInfo
 
-from googleapiclient.discovery import build
-
-from .calendar_google import _load_creds
+from .calendar_google import _load_creds, build
 from .models import Reminder
 
 
@@ -1,4 +1,6 @@
 from __future__ import annotations
+import bisect
+import functools
 from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional
 from zoneinfo import ZoneInfo
@@ -7,11 +9,17 @@ from PIL import Image, ImageDraw, ImageFont
 from .models import Event, Reminder
 from .weather import WeatherAlert
 
+# Opening a FreeType face reads and parses the whole TTF, and the renderers
+# ask for the same handful of sizes repeatedly (the tomorrow section tries
+# several), so faces are cached per size. Fonts are only read from, never
+# mutated, so sharing them is safe.
+@functools.lru_cache(maxsize=32)
 def _load_font(size: int) -> ImageFont.FreeTypeFont:
     # DejaVu is commonly available on Raspberry Pi; install via apt in scripts/install.sh
     return ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", size)
 
 
+@functools.lru_cache(maxsize=32)
 def _load_bold_font(size: int) -> ImageFont.FreeTypeFont:
     return ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", size)
 
@@ -20,7 +28,15 @@ def _format_header(now: datetime) -> tuple[str, str]:
     return now.strftime("%A"), now.strftime("%B %-d, %Y")
 
 def _fmt_time(dt: datetime) -> str:
-    return dt.strftime("%-I:%M %p").lower()
+    # Same as strftime("%-I:%M %p").lower(), without the locale-dependent
+    # %p or the glibc-only %-I.
+    hour = dt.hour % 12 or 12
+    return f"{hour}:{dt.minute:02d} {'am' if dt.hour < 12 else 'pm'}"
+
+
+def _time_range_text(e: Event) -> str:
+    # Time column text; all-day events have none.
+    return "" if e.all_day else f"{_fmt_time(e.start)}–{_fmt_time(e.end)}"
 
 def _event_sort_key(e: Event):
     # all-day first, then start time, then title
@@ -92,21 +108,26 @@ def _lerp_color(start: tuple[int, int, int], end: tuple[int, int, int], ratio: f
     return tuple(int(round(s + (e - s) * ratio)) for s, e in zip(start, end))
 
 
+# Classic cold->hot weather palette.
+_TEMPERATURE_ANCHORS = (
+    (-20, (49, 54, 149)),
+    (32, (66, 165, 245)),
+    (50, (38, 198, 218)),
+    (68, (102, 187, 106)),
+    (80, (255, 241, 118)),
+    (92, (255, 167, 38)),
+    (110, (229, 57, 53)),
+)
+
+
+# Temperatures are whole degrees in a narrow range, so each distinct value
+# is interpolated once.
+@functools.lru_cache(maxsize=256)
 def _temperature_color(temp_f: Optional[int]) -> tuple[int, int, int]:
     if temp_f is None:
         return (0, 0, 0)
 
-    # Classic cold->hot weather palette.
-    anchors = [
-        (-20, (49, 54, 149)),
-        (32, (66, 165, 245)),
-        (50, (38, 198, 218)),
-        (68, (102, 187, 106)),
-        (80, (255, 241, 118)),
-        (92, (255, 167, 38)),
-        (110, (229, 57, 53)),
-    ]
-
+    anchors = _TEMPERATURE_ANCHORS
     if temp_f <= anchors[0][0]:
         return anchors[0][1]
     if temp_f >= anchors[-1][0]:
@@ -199,6 +220,13 @@ def _draw_weather_text(
         )
 
 
+@functools.lru_cache(maxsize=4096)
+def _text_length(font: ImageFont.FreeTypeFont, text: str, fontmode: str) -> float:
+    # Same measurement ImageDraw.textlength makes; fontmode is part of the key
+    # because "1" (bilevel) and "L" (antialiased) hinting can measure differently.
+    return font.getlength(text, fontmode)
+
+
 def _wrap_text(
     draw: ImageDraw.ImageDraw,
     text: str,
@@ -206,25 +234,36 @@ def _wrap_text(
     max_width: float,
     max_lines: Optional[int] = 2,
 ) -> List[str]:
+    # Greedy wrap from cached per-word widths. Words are joined by single
+    # spaces, and PIL lays out a space-joined line as the sum of its words
+    # and spaces, so with ends[i] = width of words[:i] plus i spaces, words
+    # j..k-1 fit on a line when ends[k] - ends[j] - space_w <= max_width.
+    # Each break is then one bisect. FreeType advances are 1/64px multiples,
+    # so these float sums and differences are exact.
     words = text.split()
-    lines: List[str] = []
-    cur = ""
+    space_w = _text_length(font, " ", draw.fontmode)
+    ends = [0.0]
     for w in words:
-        test = (cur + " " + w).strip()
-        if draw.textlength(test, font=font) <= max_width:
-            cur = test
-        else:
-            if cur:
-                lines.append(cur)
-            cur = w
-    if cur:
-        lines.append(cur)
-    return lines if max_lines is None else lines[:max_lines]
+        ends.append(ends[-1] + _text_length(font, w, draw.fontmode) + space_w)
+
+    lines: List[str] = []
+    start = 0
+    while start < len(words) and (max_lines is None or len(lines) < max_lines):
+        end = bisect.bisect_right(ends, ends[start] + space_w + max_width) - 1
+        # A word wider than the line still gets a line of its own.
+        end = max(end, start + 1)
+        lines.append(" ".join(words[start:end]))
+        start = end
+    return lines
 
 
 def _today_event_layout(
     draw: ImageDraw.ImageDraw,
     event: Event,
+    time_str: str,
+    time_w: float,
+    weather_label: str,
+    weather_w: float,
     canvas_w: int,
     padding: int,
     time_col_w: float,
@@ -236,7 +275,6 @@ def _today_event_layout(
     title_line_h: int,
     min_row_h: int,
 ) -> dict:
-    time_str = "" if event.all_day else f"{_fmt_time(event.start)}–{_fmt_time(event.end)}"
     x_title = padding if event.all_day else padding + time_col_w + column_gap
     max_width = (canvas_w - (2 * padding)) if event.all_day else (canvas_w - padding - x_title)
     max_lines = None if event.all_day else 2
@@ -250,13 +288,16 @@ def _today_event_layout(
     left_col_h = 0
     if time_str:
         left_col_h = font_time.size
-        if _weather_label(event):
+        if weather_label:
             left_col_h += 4 + font_today_weather.size
 
     row_h = max(min_row_h, content_h + 8, left_col_h + 8)
     return {
         "event": event,
         "time_str": time_str,
+        "time_w": time_w,
+        "weather_label": weather_label,
+        "weather_w": weather_w,
         "x_title": x_title,
         "lines": lines,
         "detail_text": detail_text,
@@ -343,6 +384,17 @@ def _draw_reminders_region(
     return y
 
 
+# Tomorrow-section size profiles, largest first; the first one whose rows
+# all fit in the remaining space is used, else the last.
+TOMORROW_PROFILES = (
+    {"time": 30, "title": 34, "title_line_h": 32, "min_row_h": 55, "sep": 14},
+    {"time": 28, "title": 32, "title_line_h": 30, "min_row_h": 52, "sep": 12},
+    {"time": 26, "title": 30, "title_line_h": 28, "min_row_h": 48, "sep": 10},
+    {"time": 24, "title": 28, "title_line_h": 26, "min_row_h": 44, "sep": 8},
+    {"time": 22, "title": 26, "title_line_h": 24, "min_row_h": 42, "sep": 8},
+)
+
+
 def render_daily_schedule(
     canvas_w: int,
     canvas_h: int,
@@ -357,7 +409,11 @@ def render_daily_schedule(
     weather_alerts: Optional[List[WeatherAlert]] = None,
     reminders: Optional[List[Reminder]] = None,
     update_pending: bool = False,
+    events_presorted: bool = False,
 ) -> Image.Image:
+    # events_presorted: `events` and `tomorrow_events` are already in
+    # _event_sort_key order (as main's processing leaves them), so the
+    # sorts here can be skipped.
     img = Image.new("RGB", (canvas_w, canvas_h), "white")
     d = ImageDraw.Draw(img)
 
@@ -377,7 +433,8 @@ def render_daily_schedule(
     padding = 40
     y = padding
 
-    header_day, header_date = _format_header(now.astimezone(tz))
+    now_local = now.astimezone(tz)
+    header_day, header_date = _format_header(now_local)
     header_gap = 8
     header_bottom_gap = 12
     header_line_h = font_header.size + 6
@@ -394,18 +451,18 @@ def render_daily_schedule(
     d.line((padding, y, canvas_w - padding, y), fill="black", width=2)
     y += 25
 
-    events_sorted = sorted(events, key=_event_sort_key)
-
-    time_strings = [f"{_fmt_time(e.start)}–{_fmt_time(e.end)}" for e in events_sorted if not e.all_day]
-    max_time_w = max((d.textlength(s, font=font_time) for s in time_strings), default=0)
-    max_weather_w = max(
-        (
-            _weather_text_width(d, e, font_today_weather, font_today_weather_bold)
-            for e in events_sorted
-            if not e.all_day and _weather_label(e)
-        ),
-        default=0,
-    )
+    events_sorted = events if events_presorted else sorted(events, key=_event_sort_key)
+
+    # Built and measured once; the layout and draw passes below reuse them.
+    time_strings = [_time_range_text(e) for e in events_sorted]
+    time_widths = [d.textlength(s, font=font_time) if s else 0.0 for s in time_strings]
+    weather_labels = ["" if e.all_day else _weather_label(e) for e in events_sorted]
+    weather_widths = [
+        _weather_text_width(d, e, font_today_weather, font_today_weather_bold) if label else 0.0
+        for e, label in zip(events_sorted, weather_labels)
+    ]
+    max_time_w = max(time_widths, default=0)
+    max_weather_w = max(weather_widths, default=0)
     time_col_w = max(max_time_w, max_weather_w)
     column_gap = 20
     title_line_h = font_title.size + 8
@@ -414,7 +471,7 @@ def render_daily_schedule(
     ups_text = _format_ups_status(ups_status)
     updated_gap = 10
     updated_text_h = font_small.size + 6
-    updated_text = f"Updated: {now.astimezone(tz).strftime('%-I:%M %p').lower()}"
+    updated_text = f"Updated: {_fmt_time(now_local)}"
     updated_text_w = d.textlength(updated_text, font=font_small)
     updated_block_h = updated_text_h + updated_gap
     ups_on_second_line = False
@@ -467,6 +524,10 @@ def render_daily_schedule(
         _today_event_layout(
             d,
             e,
+            time_str,
+            time_w,
+            weather_label,
+            weather_w,
             canvas_w,
             padding,
             time_col_w,
@@ -478,12 +539,13 @@ def render_daily_schedule(
             title_line_h,
             min_row_h,
         )
-        for e in events_sorted
+        for e, time_str, time_w, weather_label, weather_w in zip(
+            events_sorted, time_strings, time_widths, weather_labels, weather_widths
+        )
     ]
     overflow_mode = y + sum(layout["total_row_h"] for layout in today_layouts) > max_y
 
     if overflow_mode:
-        now_local = now.astimezone(tz)
         pending_layouts = [
             layout for layout in today_layouts if layout["event"].all_day or layout["event"].end > now_local
         ]
@@ -525,13 +587,10 @@ def render_daily_schedule(
 
         # Time column
         if time_str:
-            time_w = d.textlength(time_str, font=font_time)
-            x_time = padding + max(0, time_col_w - time_w)
+            x_time = padding + max(0, time_col_w - layout["time_w"])
             d.text((x_time, y), time_str, fill="black", font=font_time)
-            weather_text = _weather_label(e)
-            if weather_text:
-                weather_w = _weather_text_width(d, e, font_today_weather, font_today_weather_bold)
-                x_weather = padding + max(0, (time_col_w - weather_w) / 2)
+            if layout["weather_label"]:
+                x_weather = padding + max(0, (time_col_w - layout["weather_w"]) / 2)
                 _draw_weather_text(
                     d,
                     x_weather,
@@ -566,7 +625,7 @@ def render_daily_schedule(
         d.text((padding, y), f"Plus {hidden_count} more events", fill="black", font=font_small)
         y += font_small.size + 8
     if tomorrow_events:
-        tomorrow_sorted = sorted(tomorrow_events, key=_event_sort_key)
+        tomorrow_sorted = tomorrow_events if events_presorted else sorted(tomorrow_events, key=_event_sort_key)
         header_gap = 10
         tomorrow_header_h = 38
         if y + header_gap + tomorrow_header_h < max_y:
@@ -576,37 +635,36 @@ def render_daily_schedule(
             d.line((padding, y, canvas_w - padding, y), fill="black", width=1)
             y += 16
 
-            tomorrow_profiles = [
-                {"time": 30, "title": 34, "title_line_h": 32, "min_row_h": 55, "sep": 14},
-                {"time": 28, "title": 32, "title_line_h": 30, "min_row_h": 52, "sep": 12},
-                {"time": 26, "title": 30, "title_line_h": 28, "min_row_h": 48, "sep": 10},
-                {"time": 24, "title": 28, "title_line_h": 26, "min_row_h": 44, "sep": 8},
-                {"time": 22, "title": 26, "title_line_h": 24, "min_row_h": 42, "sep": 8},
-            ]
-
-            chosen_profile = tomorrow_profiles[-1]
+            # The time strings don't depend on the profile; only their
+            # measured widths do.
+            tomorrow_time_strings = [_time_range_text(e) for e in tomorrow_sorted]
+            # Nor do the weather labels, and the weather fonts are fixed, so
+            # the weather column is one width for every profile.
+            tomorrow_weather_labels = ["" if e.all_day else _weather_label(e) for e in tomorrow_sorted]
+            weather_col_w = max(
+                (
+                    _weather_text_width(d, e, font_tomorrow_weather, font_tomorrow_weather_bold)
+                    for e, label in zip(tomorrow_sorted, tomorrow_weather_labels)
+                    if label
+                ),
+                default=0,
+            )
+            chosen_profile = TOMORROW_PROFILES[-1]
             chosen_lines: List[List[str]] = []
-            chosen_time_strings: List[str] = []
-            for profile in tomorrow_profiles:
+            chosen_time_widths: List[float] = []
+            for profile in TOMORROW_PROFILES:
+                # Every row is at least min_row_h + sep tall, so a profile
+                # whose minimum height already overflows can't fit; skip
+                # measuring and wrapping for it.
+                if y + len(tomorrow_sorted) * (profile["min_row_h"] + profile["sep"]) > max_y:
+                    continue
                 profile_time_font = _load_font(profile["time"])
                 profile_title_font = _load_font(profile["title"])
-                profile_time_strings = [
-                    f"{_fmt_time(e.start)}–{_fmt_time(e.end)}"
-                    for e in tomorrow_sorted
-                    if not e.all_day
+                profile_time_widths = [
+                    d.textlength(s, font=profile_time_font) if s else 0.0
+                    for s in tomorrow_time_strings
                 ]
-                profile_time_w = max(
-                    (d.textlength(s, font=profile_time_font) for s in profile_time_strings),
-                    default=0,
-                )
-                profile_weather_w = max(
-                    (
-                        _weather_text_width(d, e, font_tomorrow_weather, font_tomorrow_weather_bold)
-                        for e in tomorrow_sorted
-                        if not e.all_day and _weather_label(e)
-                    ),
-                    default=0,
-                )
+                profile_time_w = max(profile_time_widths, default=0)
                 profile_gap = int(profile_time_font.size * 0.45)
                 profile_lines = [
                     _wrap_text(
@@ -615,21 +673,21 @@ def render_daily_schedule(
                         profile_title_font,
                         (canvas_w - (2 * padding))
                         if e.all_day
-                        else (canvas_w - padding - (padding + profile_time_w + profile_weather_w + (profile_gap * 2))),
+                        else (canvas_w - padding - (padding + profile_time_w + weather_col_w + (profile_gap * 2))),
                         max_lines=None if e.all_day else 2,
                     )
                     for e in tomorrow_sorted
                 ]
                 test_y = y
                 fits = True
-                for e, lines in zip(tomorrow_sorted, profile_lines):
+                for e, lines, weather_label in zip(tomorrow_sorted, profile_lines, tomorrow_weather_labels):
                     content_y = test_y + profile["title_line_h"] * len(lines) + 4
                     if (e.travel_time_text or "").strip():
                         content_y += font_small.size + 6
                     profile_left_col_h = 0
                     if not e.all_day:
                         profile_left_col_h = profile_time_font.size
-                        if _weather_label(e):
+                        if weather_label:
                             profile_left_col_h += 4 + font_tomorrow_weather.size
                     row_h = max(profile["min_row_h"], content_y - test_y + 6, profile_left_col_h + 6)
                     total_h = row_h + profile["sep"]
@@ -637,32 +695,24 @@ def render_daily_schedule(
                         fits = False
                         break
                     test_y += total_h
-                if fits:
+                if fits or profile is chosen_profile:
+                    # The last profile is also the fallback, so its wrap is
+                    # kept even when it doesn't fit.
                     chosen_profile = profile
                     chosen_lines = profile_lines
-                    chosen_time_strings = profile_time_strings
+                    chosen_time_widths = profile_time_widths
                     break
 
             time_font = _load_font(chosen_profile["time"])
             title_font = _load_font(chosen_profile["title"])
             if not chosen_lines:
-                chosen_time_strings = [
-                    f"{_fmt_time(e.start)}–{_fmt_time(e.end)}"
-                    for e in tomorrow_sorted
-                    if not e.all_day
+                # Only reached when the minimum-height check skipped the
+                # fallback profile before it was wrapped.
+                chosen_time_widths = [
+                    d.textlength(s, font=time_font) if s else 0.0
+                    for s in tomorrow_time_strings
                 ]
-                fallback_time_w = max(
-                    (d.textlength(s, font=time_font) for s in chosen_time_strings),
-                    default=0,
-                )
-                fallback_weather_w = max(
-                    (
-                        _weather_text_width(d, e, font_tomorrow_weather, font_tomorrow_weather_bold)
-                        for e in tomorrow_sorted
-                        if not e.all_day and _weather_label(e)
-                    ),
-                    default=0,
-                )
+                fallback_time_w = max(chosen_time_widths, default=0)
                 fallback_gap = int(time_font.size * 0.45)
                 chosen_lines = [
                     _wrap_text(
@@ -671,51 +721,42 @@ def render_daily_schedule(
                         title_font,
                         (canvas_w - (2 * padding))
                         if e.all_day
-                        else (canvas_w - padding - (padding + fallback_time_w + fallback_weather_w + (fallback_gap * 2))),
+                        else (canvas_w - padding - (padding + fallback_time_w + weather_col_w + (fallback_gap * 2))),
                         max_lines=None if e.all_day else 2,
                     )
                     for e in tomorrow_sorted
                 ]
 
-            time_col_w = max(
-                (d.textlength(s, font=time_font) for s in chosen_time_strings),
-                default=0,
-            )
-            weather_col_w = max(
-                (
-                    _weather_text_width(d, e, font_tomorrow_weather, font_tomorrow_weather_bold)
-                    for e in tomorrow_sorted
-                    if not e.all_day and _weather_label(e)
-                ),
-                default=0,
-            )
+            time_col_w = max(chosen_time_widths, default=0)
             gap = int(time_font.size * 0.45)
             weather_divider_padding = 12
+            row_line_h = chosen_profile["title_line_h"]
+            row_min_h = chosen_profile["min_row_h"]
+            row_sep = chosen_profile["sep"]
 
-            for e, lines in zip(tomorrow_sorted, chosen_lines):
-                time_str = "" if e.all_day else f"{_fmt_time(e.start)}–{_fmt_time(e.end)}"
+            for e, lines, time_str, time_w, weather_label in zip(
+                tomorrow_sorted, chosen_lines, tomorrow_time_strings, chosen_time_widths, tomorrow_weather_labels
+            ):
                 row_start_y = y
-                content_y = row_start_y + chosen_profile["title_line_h"] * len(lines) + 4
+                content_y = row_start_y + row_line_h * len(lines) + 4
                 detail_text = (e.travel_time_text or "").strip()
                 if detail_text:
                     content_y += font_small.size + 6
                 left_col_h = 0
                 if time_str:
                     left_col_h = time_font.size
-                    if _weather_label(e):
+                    if weather_label:
                         left_col_h = max(left_col_h, font_tomorrow_weather.size)
-                row_h = max(chosen_profile["min_row_h"], content_y - row_start_y + 6, left_col_h + 6)
-                total_h = row_h + chosen_profile["sep"]
+                row_h = max(row_min_h, content_y - row_start_y + 6, left_col_h + 6)
+                total_h = row_h + row_sep
 
                 if y + total_h > max_y:
                     d.text((padding, y), "…", fill="black", font=font_tomorrow_header)
                     break
 
                 if time_str:
-                    time_w = d.textlength(time_str, font=time_font)
                     d.text((padding + max(0, time_col_w - time_w), y), time_str, fill="black", font=time_font)
-                    weather_text = _weather_label(e)
-                    if weather_text:
+                    if weather_label:
                         _draw_weather_text(
                             d,
                             padding + time_col_w + gap,
@@ -733,7 +774,7 @@ def render_daily_schedule(
                 x_title = padding if e.all_day else second_divider_x + (gap // 2)
                 for i, line in enumerate(lines):
                     d.text(
-                        (x_title, y + i * chosen_profile["title_line_h"]),
+                        (x_title, y + i * row_line_h),
                         line,
                         fill="black",
                         font=title_font,
@@ -741,7 +782,7 @@ def render_daily_schedule(
 
                 if detail_text:
                     d.text(
-                        (x_title, row_start_y + chosen_profile["title_line_h"] * len(lines) + 4),
+                        (x_title, row_start_y + row_line_h * len(lines) + 4),
                         detail_text,
                         fill="black",
                         font=font_small,
@@ -749,7 +790,7 @@ def render_daily_schedule(
 
                 y = row_start_y + row_h
                 d.line((padding, y, canvas_w - padding, y), fill="black", width=1)
-                y += chosen_profile["sep"]
+                y += row_sep
     bottom_y = canvas_h - padding - (banner_h if show_sleep_banner else 0)
     alert_bottom_y = bottom_y - updated_block_h
     if weather_alert_lines:
@@ -869,7 +910,7 @@ def render_weekly_schedule(
     banner_h = 70
     ups_text = _format_ups_status(ups_status)
     ota_text = _format_update_status(update_pending)
-    updated_text = f"Updated: {now_local.strftime('%-I:%M %p').lower()}"
+    updated_text = f"Updated: {_fmt_time(now_local)}"
     footer_line_h = font_small.size + 6
     footer_block_h = footer_line_h + 10
     if ups_text:
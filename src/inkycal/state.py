@@ -1,5 +1,5 @@
 from __future__ import annotations
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from pathlib import Path
 from typing import Optional, Dict, Any
 import json
@@ -10,6 +10,16 @@ class State:
     last_rendered_iso: str = ""
     last_sleep_banner_date: str = ""  # YYYY-MM-DD when banner was last applied
     view_mode: str = "daily"  # "daily" or "weekly"; set by the view-toggle button
+    # Per Google calendar id: the last sync token, the window it covers, and
+    # the events seen so far (see calendar_google._synced_items).
+    google_sync: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # Per iCloud calendar URL: the CTag, window and parsed events from the
+    # last search (see calendar_icloud._cached_search).
+    icloud_sync: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # TravelTimeResolver.cache_snapshot() from the last run that used it.
+    travel_cache: Dict[str, Any] = field(default_factory=dict)
+    # WeatherForecastResolver.cache_snapshot() from the last redraw.
+    weather_cache: Dict[str, Any] = field(default_factory=dict)
 
 def load_state(path: str) -> State:
     p = Path(path)
@@ -19,11 +29,27 @@ def load_state(path: str) -> State:
     view_mode = str(data.get("view_mode", "daily"))
     if view_mode not in ("daily", "weekly"):
         view_mode = "daily"
+    google_sync = data.get("google_sync", {})
+    if not isinstance(google_sync, dict):
+        google_sync = {}
+    icloud_sync = data.get("icloud_sync", {})
+    if not isinstance(icloud_sync, dict):
+        icloud_sync = {}
+    travel_cache = data.get("travel_cache", {})
+    if not isinstance(travel_cache, dict):
+        travel_cache = {}
+    weather_cache = data.get("weather_cache", {})
+    if not isinstance(weather_cache, dict):
+        weather_cache = {}
     return State(
         last_hash=str(data.get("last_hash", "")),
         last_rendered_iso=str(data.get("last_rendered_iso", "")),
         last_sleep_banner_date=str(data.get("last_sleep_banner_date", "")),
         view_mode=view_mode,
+        google_sync=google_sync,
+        icloud_sync=icloud_sync,
+        travel_cache=travel_cache,
+        weather_cache=weather_cache,
     )
 
 def save_state(path: str, state: State) -> None:
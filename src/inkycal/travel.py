@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 import requests
 
@@ -12,14 +12,62 @@ class TravelEstimate:
     text: str
 
 
+# Upper bound on entries kept by cache_snapshot(), so the persisted cache
+# can't grow without limit as calendars change over months.
+MAX_PERSISTED_ENTRIES = 256
+
+# Joins (origin, destination) into one JSON object key.
+_KEY_SEP = "\x1f"
+
+
 class TravelTimeResolver:
-    """Resolves travel time between two address strings with simple in-memory caching."""
+    """Resolves travel time between two address strings with simple in-memory caching.
+
+    The cache can be seeded from, and exported to, a JSON-safe dict (see
+    cache_snapshot) so lookups survive between runs.
+    """
 
-    def __init__(self, user_agent: str = "inkycal/1.0") -> None:
+    def __init__(self, user_agent: str = "inkycal/1.0", cache: Optional[Dict[str, Any]] = None) -> None:
         self._session = requests.Session()
         self._session.headers.update({"User-Agent": user_agent})
         self._geocode_cache: Dict[str, Optional[Tuple[float, float]]] = {}
         self._duration_cache: Dict[Tuple[str, str], Optional[TravelEstimate]] = {}
+        if cache:
+            self._load_cache(cache)
+
+    def _load_cache(self, cache: Dict[str, Any]) -> None:
+        try:
+            for address, latlon in (cache.get("geocode") or {}).items():
+                self._geocode_cache[address] = (float(latlon[0]), float(latlon[1]))
+            for key, minutes in (cache.get("durations") or {}).items():
+                origin, _, destination = key.partition(_KEY_SEP)
+                minutes = int(minutes)
+                self._duration_cache[(origin, destination)] = TravelEstimate(minutes=minutes, text=f"{minutes} min")
+        except (AttributeError, TypeError, ValueError, IndexError):
+            # A malformed cache just means starting cold.
+            self._geocode_cache.clear()
+            self._duration_cache.clear()
+
+    def cache_snapshot(self) -> Dict[str, Any]:
+        """Successful lookups as a JSON-safe dict, for seeding a later resolver.
+
+        Failed lookups (None) are left out so a transient outage isn't
+        remembered past this run.
+        """
+        geocode = {
+            address: [latlon[0], latlon[1]]
+            for address, latlon in self._geocode_cache.items()
+            if latlon is not None
+        }
+        durations = {
+            f"{origin}{_KEY_SEP}{destination}": estimate.minutes
+            for (origin, destination), estimate in self._duration_cache.items()
+            if estimate is not None
+        }
+        return {
+            "geocode": dict(list(geocode.items())[-MAX_PERSISTED_ENTRIES:]),
+            "durations": dict(list(durations.items())[-MAX_PERSISTED_ENTRIES:]),
+        }
 
     def estimate(self, origin: str, destination: str) -> Optional[TravelEstimate]:
         origin_norm = _normalize(origin)
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Dict, List, Optional
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
 from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 
@@ -42,16 +42,82 @@ def _weather_icon(weather_code: int) -> str:
     return "☁"
 
 
+# How long a downloaded forecast may be reused by later runs (see
+# WeatherForecastResolver.cache_snapshot).
+FORECAST_MAX_AGE = timedelta(hours=1)
+
+
 class WeatherForecastResolver:
-    def __init__(self, timezone: str, latitude: float, longitude: float):
+    """Hourly forecast lookups for one location.
+
+    Every lookup is answered from the same 3-day hourly forecast, so it is
+    downloaded once per resolver and reused for the rest of the run. The
+    table can be seeded from, and exported to, a JSON-safe dict so a recent
+    download also serves later runs.
+    """
+
+    def __init__(
+        self,
+        timezone: str,
+        latitude: float,
+        longitude: float,
+        cache: Optional[Dict[str, Any]] = None,
+    ):
         self.timezone = timezone
         self.latitude = latitude
         self.longitude = longitude
+        self._by_hour: Optional[Dict[str, tuple[float, int]]] = None
+        self._fetched_at: Optional[datetime] = None
+        if cache:
+            self._load_cache(cache)
+
+    def _cache_key(self) -> str:
+        return f"{self.latitude},{self.longitude},{self.timezone}"
+
+    def _load_cache(self, cache: Dict[str, Any]) -> None:
+        try:
+            if cache.get("key") != self._cache_key():
+                return
+            fetched_at = datetime.fromisoformat(cache["fetched_at"])
+            age = datetime.now().astimezone() - fetched_at
+            if not timedelta(0) <= age <= FORECAST_MAX_AGE:
+                return
+            self._by_hour = {
+                hour: (float(values[0]), int(values[1]))
+                for hour, values in cache["hourly"].items()
+            }
+            self._fetched_at = fetched_at
+        except (AttributeError, KeyError, TypeError, ValueError, IndexError):
+            # A malformed cache just means downloading again.
+            self._by_hour = None
+            self._fetched_at = None
+
+    def cache_snapshot(self) -> Dict[str, Any]:
+        """The downloaded forecast as a JSON-safe dict, or {} if there is none."""
+        if not self._by_hour or self._fetched_at is None:
+            return {}
+        return {
+            "key": self._cache_key(),
+            "fetched_at": self._fetched_at.isoformat(),
+            "hourly": {hour: [temp, code] for hour, (temp, code) in self._by_hour.items()},
+        }
 
     def forecast_for_datetime(self, forecast_time: datetime) -> Optional[WeatherAtTime]:
         if forecast_time.tzinfo is None:
             return None
 
+        hour_key = forecast_time.strftime("%Y-%m-%dT%H:00")
+        values = self._hourly().get(hour_key)
+        if values is None:
+            return None
+
+        temp, code = values
+        return WeatherAtTime(temperature_f=int(round(temp)), icon=_weather_icon(code))
+
+    def _hourly(self) -> Dict[str, tuple[float, int]]:
+        if self._by_hour is not None:
+            return self._by_hour
+
         params = urlencode(
             {
                 "latitude": self.latitude,
@@ -72,20 +138,16 @@ class WeatherForecastResolver:
         temps = hourly.get("temperature_2m", [])
         codes = hourly.get("weather_code", [])
 
-        if not times or len(times) != len(temps) or len(times) != len(codes):
-            return None
-
         by_hour: Dict[str, tuple[float, int]] = {}
-        for t, temp, code in zip(times, temps, codes):
-            by_hour[t] = (float(temp), int(code))
-
-        hour_key = forecast_time.strftime("%Y-%m-%dT%H:00")
-        values = by_hour.get(hour_key)
-        if values is None:
-            return None
-
-        temp, code = values
-        return WeatherAtTime(temperature_f=int(round(temp)), icon=_weather_icon(code))
+        if times and len(times) == len(temps) == len(codes):
+            for t, temp, code in zip(times, temps, codes):
+                by_hour[t] = (float(temp), int(code))
+
+        # Request errors propagate without being cached, so a later lookup
+        # can still retry.
+        self._by_hour = by_hour
+        self._fetched_at = datetime.now().astimezone()
+        return by_hour
 
     def forecast_for_event_start(self, event_start: datetime) -> Optional[WeatherAtTime]:
         return self.forecast_for_datetime(event_start)
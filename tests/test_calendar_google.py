@@ -0,0 +1,157 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import inkycal.calendar_google as cg
+
+
+class _FakeExecutable:
+    def __init__(self, result):
+        self._result = result
+
+    def execute(self):
+        return self._result
+
+
+class _FakeEvents:
+    def __init__(self, by_calendar):
+        self._by_calendar = by_calendar
+        self.calls = []
+
+    def list(self, calendarId, **kwargs):
+        self.calls.append((calendarId, kwargs))
+        return _FakeExecutable({"items": self._by_calendar.get(calendarId, [])})
+
+
+class _FakeService:
+    def __init__(self, by_calendar):
+        self._events = _FakeEvents(by_calendar)
+
+    def events(self):
+        return self._events
+
+
+def _patch(monkeypatch, by_calendar):
+    service = _FakeService(by_calendar)
+    monkeypatch.setattr(cg, "_load_creds", lambda token_path: object())
+    monkeypatch.setattr(cg, "build", lambda *a, **k: service)
+    return service
+
+
+def _timed(summary, start, end):
+    return {"summary": summary, "start": {"dateTime": start}, "end": {"dateTime": end}}
+
+
+def test_multi_window_fetch_lists_each_calendar_once_and_splits_by_window(monkeypatch):
+    tz = ZoneInfo("America/Phoenix")
+    service = _patch(
+        monkeypatch,
+        {
+            "primary": [
+                _timed("Standup", "2026-02-05T09:00:00-07:00", "2026-02-05T09:30:00-07:00"),
+                _timed("Late shift", "2026-02-05T23:00:00-07:00", "2026-02-06T01:00:00-07:00"),
+                _timed("Dentist", "2026-02-06T14:00:00-07:00", "2026-02-06T15:00:00-07:00"),
+            ],
+        },
+    )
+    today = datetime(2026, 2, 5, tzinfo=tz)
+    tomorrow = datetime(2026, 2, 6, tzinfo=tz)
+    day_after = datetime(2026, 2, 7, tzinfo=tz)
+
+    result = cg.fetch_google_events_multi(
+        ["primary"],
+        [("today", today, tomorrow), ("tomorrow", tomorrow, day_after)],
+        tz,
+        "/tmp/token.json",
+    )
+
+    assert len(service.events().calls) == 1
+    _, kwargs = service.events().calls[0]
+    assert kwargs["timeMin"] == today.isoformat()
+    assert kwargs["timeMax"] == day_after.isoformat()
+    assert kwargs["fields"].startswith("items(id,iCalUID,summary,location,start,end,status)")
+    assert [e.title for e in result["today"]] == ["Standup", "Late shift"]
+    # An event crossing midnight shows up in both windows, like separate calls would.
+    assert [e.title for e in result["tomorrow"]] == ["Late shift", "Dentist"]
+
+
+class _ScriptedEvents:
+    """Returns one scripted response (or raises) per events.list call."""
+
+    def __init__(self, responses):
+        self._responses = list(responses)
+        self.calls = []
+
+    def list(self, **kwargs):
+        self.calls.append(kwargs)
+        response = self._responses.pop(0)
+        if isinstance(response, Exception):
+            class _Raising:
+                def execute(self_inner):
+                    raise response
+            return _Raising()
+        return _FakeExecutable(response)
+
+
+def _patch_scripted(monkeypatch, responses):
+    events = _ScriptedEvents(responses)
+    service = type("_Service", (), {"events": lambda self: events})()
+    monkeypatch.setattr(cg, "_load_creds", lambda token_path: object())
+    monkeypatch.setattr(cg, "build", lambda *a, **k: service)
+    return events
+
+
+def _gone():
+    from googleapiclient.errors import HttpError
+
+    resp = type("_Resp", (), {"status": 410, "reason": "Gone"})()
+    return HttpError(resp, b"{}")
+
+
+def test_sync_cache_applies_incremental_changes_on_the_next_run(monkeypatch):
+    tz = ZoneInfo("America/Phoenix")
+    today = datetime(2026, 2, 5, tzinfo=tz)
+    tomorrow = datetime(2026, 2, 6, tzinfo=tz)
+    standup = dict(_timed("Standup", "2026-02-05T09:00:00-07:00", "2026-02-05T09:30:00-07:00"), id="a")
+    lunch = dict(_timed("Lunch", "2026-02-05T12:00:00-07:00", "2026-02-05T13:00:00-07:00"), id="b")
+    events = _patch_scripted(
+        monkeypatch,
+        [
+            {"items": [standup, lunch], "nextSyncToken": "t1"},
+            {"items": [{"id": "a", "status": "cancelled"}], "nextSyncToken": "t2"},
+        ],
+    )
+    sync_cache = {}
+
+    first = cg.fetch_google_events_multi(["primary"], [("today", today, tomorrow)], tz, "/tmp/t", sync_cache=sync_cache)
+    second = cg.fetch_google_events_multi(["primary"], [("today", today, tomorrow)], tz, "/tmp/t", sync_cache=sync_cache)
+
+    assert {e.title for e in first["today"]} == {"Standup", "Lunch"}
+    assert [e.title for e in second["today"]] == ["Lunch"]
+    assert events.calls[1]["syncToken"] == "t1"
+    assert "timeMin" not in events.calls[1]
+    assert sync_cache["primary"]["token"] == "t2"
+
+
+def test_sync_cache_falls_back_to_full_listing_when_token_expires(monkeypatch):
+    tz = ZoneInfo("America/Phoenix")
+    today = datetime(2026, 2, 5, tzinfo=tz)
+    tomorrow = datetime(2026, 2, 6, tzinfo=tz)
+    lunch = dict(_timed("Lunch", "2026-02-05T12:00:00-07:00", "2026-02-05T13:00:00-07:00"), id="b")
+    events = _patch_scripted(
+        monkeypatch,
+        [_gone(), {"items": [lunch], "nextSyncToken": "fresh"}],
+    )
+    sync_cache = {
+        "primary": {
+            "token": "stale",
+            "time_min": today.isoformat(),
+            "time_max": tomorrow.isoformat(),
+            "items": [],
+        }
+    }
+
+    result = cg.fetch_google_events_multi(["primary"], [("today", today, tomorrow)], tz, "/tmp/t", sync_cache=sync_cache)
+
+    assert [e.title for e in result["today"]] == ["Lunch"]
+    assert events.calls[1]["timeMin"] == today.isoformat()
+    assert sync_cache["primary"]["token"] == "fresh"
@@ -0,0 +1,151 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import vobject
+
+from inkycal.calendar_icloud import _parse_vevent
+
+
+def _vevent(*lines: str):
+    body = "\n".join(["BEGIN:VCALENDAR", "BEGIN:VEVENT", *lines, "END:VEVENT", "END:VCALENDAR", ""])
+    return vobject.readOne(body).vevent
+
+
+def test_parse_vevent_converts_timed_event_to_display_timezone():
+    tz = ZoneInfo("America/Phoenix")
+    vevent = _vevent(
+        "SUMMARY:Standup",
+        "LOCATION:HQ East",
+        "DTSTART:20260205T160000Z",
+        "DTEND:20260205T163000Z",
+    )
+
+    event = _parse_vevent(vevent, tz)
+
+    assert event.title == "Standup"
+    assert event.location == "HQ East"
+    assert event.start == datetime(2026, 2, 5, 9, 0, tzinfo=tz)
+    assert event.start.tzinfo is tz
+    assert event.end.tzinfo is tz
+    assert event.all_day is False
+
+
+def test_parse_vevent_handles_all_day_event_without_summary_or_location():
+    tz = ZoneInfo("America/Phoenix")
+    vevent = _vevent("DTSTART;VALUE=DATE:20260205", "DTEND;VALUE=DATE:20260206")
+
+    event = _parse_vevent(vevent, tz)
+
+    assert event.title == "(No title)"
+    assert event.location is None
+    assert event.all_day is True
+    assert event.start == datetime(2026, 2, 5, tzinfo=tz)
+    assert event.end == datetime(2026, 2, 6, tzinfo=tz)
+
+
+class _FakeResult:
+    def __init__(self, vevent):
+        self.vobject_instance = type("_VObj", (), {"contents": {"vevent": [vevent]}})()
+
+
+class _FakeCalendar:
+    def __init__(self, ctag, vevents):
+        self.url = "https://caldav.example.com/cal/home/"
+        self.name = "Home"
+        self.ctag = ctag
+        self._vevents = vevents
+        self.searches = 0
+
+    def get_property(self, prop):
+        return self.ctag
+
+    def search(self, **kwargs):
+        self.searches += 1
+        self.last_search = kwargs
+        return [_FakeResult(v) for v in self._vevents]
+
+
+def test_unchanged_ctag_reuses_cached_events_without_searching(monkeypatch):
+    import inkycal.calendar_icloud as ci
+
+    tz = ZoneInfo("America/Phoenix")
+    cal = _FakeCalendar("ctag-1", [_vevent("SUMMARY:Standup", "DTSTART:20260205T160000Z", "DTEND:20260205T163000Z")])
+    monkeypatch.setattr(ci, "_icloud_calendars", lambda user, pw: [cal])
+    windows = [("today", datetime(2026, 2, 5, tzinfo=tz), datetime(2026, 2, 6, tzinfo=tz))]
+    sync_cache = {}
+
+    first = ci.fetch_icloud_events_multi(windows, tz, "u", "p", [], sync_cache=sync_cache)
+    second = ci.fetch_icloud_events_multi(windows, tz, "u", "p", [], sync_cache=sync_cache)
+    cal.ctag = "ctag-2"
+    ci.fetch_icloud_events_multi(windows, tz, "u", "p", [], sync_cache=sync_cache)
+
+    assert first == second
+    assert second["today"][0].start == datetime(2026, 2, 5, 9, 0, tzinfo=tz)
+    # Searched on the first run and again only after the CTag changed.
+    assert cal.searches == 2
+
+
+def test_calendars_are_searched_with_search_and_expansion(monkeypatch):
+    import inkycal.calendar_icloud as ci
+
+    tz = ZoneInfo("America/Phoenix")
+    cal = _FakeCalendar(
+        None,
+        [
+            _vevent("SUMMARY:Standup", "DTSTART:20260205T160000Z", "DTEND:20260205T163000Z"),
+            _vevent("SUMMARY:Standup", "DTSTART:20260206T160000Z", "DTEND:20260206T163000Z"),
+        ],
+    )
+    monkeypatch.setattr(ci, "_icloud_calendars", lambda user, pw: [cal])
+    today = datetime(2026, 2, 5, tzinfo=tz)
+    tomorrow = datetime(2026, 2, 6, tzinfo=tz)
+    day_after = datetime(2026, 2, 7, tzinfo=tz)
+
+    result = ci.fetch_icloud_events_multi(
+        [("today", today, tomorrow), ("tomorrow", tomorrow, day_after)], tz, "u", "p", []
+    )
+
+    assert cal.last_search == {"start": today, "end": day_after, "event": True, "expand": True}
+    assert [e.start.day for e in result["today"]] == [5]
+    assert [e.start.day for e in result["tomorrow"]] == [6]
+
+
+def _calendar_object(*vevents):
+    # One CalDAV object holding a VEVENT per entry, the way an expanded
+    # recurring event comes back from the server.
+    body = ["BEGIN:VCALENDAR"]
+    for lines in vevents:
+        body += ["BEGIN:VEVENT", *lines, "END:VEVENT"]
+    body += ["END:VCALENDAR", ""]
+    return type("_Result", (), {"vobject_instance": vobject.readOne("\n".join(body))})()
+
+
+class _ExpandingCalendar:
+    name = "Home"
+
+    def __init__(self, results):
+        self._results = results
+
+    def search(self, **kwargs):
+        return self._results
+
+
+def test_every_occurrence_of_an_expanded_recurring_event_is_kept(monkeypatch):
+    import inkycal.calendar_icloud as ci
+
+    tz = ZoneInfo("America/Phoenix")
+    daily = _calendar_object(
+        ["UID:standup", "SUMMARY:Standup", "DTSTART:20260205T160000Z", "DTEND:20260205T163000Z"],
+        ["UID:standup", "SUMMARY:Standup", "DTSTART:20260206T160000Z", "DTEND:20260206T163000Z"],
+    )
+    monkeypatch.setattr(ci, "_icloud_calendars", lambda user, pw: [_ExpandingCalendar([daily])])
+    today = datetime(2026, 2, 5, tzinfo=tz)
+    tomorrow = datetime(2026, 2, 6, tzinfo=tz)
+    day_after = datetime(2026, 2, 7, tzinfo=tz)
+
+    result = ci.fetch_icloud_events_multi(
+        [("today", today, tomorrow), ("tomorrow", tomorrow, day_after)], tz, "u", "p", []
+    )
+
+    assert [e.start for e in result["today"]] == [datetime(2026, 2, 5, 9, 0, tzinfo=tz)]
+    assert [e.start for e in result["tomorrow"]] == [datetime(2026, 2, 6, 9, 0, tzinfo=tz)]
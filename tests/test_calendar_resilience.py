@@ -2,7 +2,8 @@ from types import SimpleNamespace
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
-from inkycal.main import _fetch_events_for_range
+from inkycal.main import _fetch_events_for_days, _fetch_events_for_range
+from inkycal.models import Event
 
 
 def test_fetch_events_for_range_continues_when_google_fetch_fails(monkeypatch, capsys):
@@ -31,3 +32,50 @@ def test_fetch_events_for_range_continues_when_google_fetch_fails(monkeypatch, c
 
     assert events == []
     assert "Google Calendar fetch failed; continuing without Google events." in out
+
+
+def test_fetch_events_for_days_splits_results_per_window(monkeypatch):
+    tz = ZoneInfo("America/Phoenix")
+    cfg = SimpleNamespace(
+        google=SimpleNamespace(enabled=True, calendar_ids=["primary"]),
+        icloud=SimpleNamespace(enabled=True, calendar_name_allowlist=[]),
+        travel=SimpleNamespace(enabled=False, origin_address="", back_to_back_window_minutes=30),
+    )
+    today = datetime(2026, 2, 5, 0, 0, tzinfo=tz)
+    tomorrow = datetime(2026, 2, 6, 0, 0, tzinfo=tz)
+    day_after = datetime(2026, 2, 7, 0, 0, tzinfo=tz)
+
+    def _event(source, start):
+        return Event(
+            source=source,
+            title=f"{source} standup",
+            start=start.replace(hour=9),
+            end=start.replace(hour=10),
+        )
+
+    monkeypatch.setenv("GOOGLE_TOKEN_JSON", "/tmp/token.json")
+    monkeypatch.setenv("ICLOUD_USERNAME", "user@example.com")
+    monkeypatch.setenv("ICLOUD_APP_PASSWORD", "app-password")
+    monkeypatch.setattr(
+        "inkycal.main.fetch_google_events_multi",
+        lambda _ids, windows, _tz, _token, **_kwargs: {
+            label: [_event("google", start)] for label, start, _end in windows
+        },
+    )
+    monkeypatch.setattr(
+        "inkycal.main.fetch_icloud_events_multi",
+        lambda windows, _tz, _user, _pw, _allow, **_kwargs: {
+            label: [_event("icloud", start)] for label, start, _end in windows
+        },
+    )
+
+    by_day = _fetch_events_for_days(
+        cfg,
+        [("today", today, tomorrow), ("tomorrow", tomorrow, day_after)],
+        tz,
+    )
+
+    assert {e.source for e in by_day["today"]} == {"google", "icloud"}
+    assert {e.source for e in by_day["tomorrow"]} == {"google", "icloud"}
+    assert all(e.start.date() == today.date() for e in by_day["today"])
+    assert all(e.start.date() == tomorrow.date() for e in by_day["tomorrow"])
@@ -0,0 +1,30 @@
+import os
+
+from inkycal.config import load_config
+
+
+def test_load_config_reuses_parsed_config_when_file_unchanged(tmp_path):
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text("timezone: 'America/Phoenix'\n", encoding="utf-8")
+
+    first = load_config(str(cfg_path))
+    second = load_config(str(cfg_path))
+
+    assert second is first
+
+
+def test_load_config_reparses_after_file_is_edited(tmp_path):
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text("timezone: 'America/Phoenix'\n", encoding="utf-8")
+    first = load_config(str(cfg_path))
+
+    cfg_path.write_text("timezone: 'America/New_York'\n", encoding="utf-8")
+    # Bump the mtime explicitly so the test doesn't depend on filesystem
+    # timestamp granularity.
+    st = cfg_path.stat()
+    os.utime(cfg_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    second = load_config(str(cfg_path))
+
+    assert first.timezone == "America/Phoenix"
+    assert second.timezone == "America/New_York"
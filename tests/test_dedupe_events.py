@@ -1,4 +1,5 @@
-from datetime import datetime
+from dataclasses import replace
+from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
 from inkycal.main import _dedupe_events
@@ -42,3 +43,34 @@ def test_dedupe_handles_whitespace_and_case_only_title_differences():
     deduped = _dedupe_events([first, second])
 
     assert len(deduped) == 1
+
+
+def test_dedupe_locationless_event_collapses_into_first_located_match():
+    sparse = _event("Planning", None)
+    west = _event("Planning", "HQ West")
+    east = _event("Planning", "HQ East")
+    late_sparse = _event("planning", None)
+
+    deduped = _dedupe_events([sparse, west, east, late_sparse])
+
+    assert [e.location for e in deduped] == ["HQ West", "HQ East"]
+
+
+def test_dedupe_collapses_copies_of_one_invite_by_uid():
+    google = replace(_event("Design review", None), uid="abc@example.com")
+    icloud = replace(_event("Design Review (Updated)", "Room 4"), source="icloud", uid="abc@example.com")
+
+    deduped = _dedupe_events([google, icloud])
+
+    assert deduped == [icloud]
+
+
+def test_dedupe_keeps_recurring_occurrences_sharing_a_uid():
+    first = replace(_event("Standup"), uid="standup@example.com")
+    next_day = replace(
+        first,
+        start=first.start + timedelta(days=1),
+        end=first.end + timedelta(days=1),
+    )
+
+    assert len(_dedupe_events([first, next_day])) == 2
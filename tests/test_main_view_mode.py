@@ -119,3 +119,26 @@ def test_fetch_events_for_week_dedupes_but_does_not_merge_all_day_events(monkeyp
     assert len(events) == 2
     assert {e.start.date() for e in events} == {monday.start.date(), friday.start.date()}
     assert "Offsite" in {e.title for e in events}
+
+
+def test_events_signature_distinguishes_today_from_tomorrow_lists():
+    tz = ZoneInfo("America/Phoenix")
+    event = Event(
+        source="google",
+        title="Standup",
+        start=datetime(2026, 2, 5, 9, 0, tzinfo=tz),
+        end=datetime(2026, 2, 5, 9, 30, tzinfo=tz),
+    )
+    kwargs = dict(
+        tz=tz,
+        weather_alerts=[],
+        header_date="Thursday, February 5, 2026",
+        sleep_banner=False,
+        wifi_status="connected",
+        ups_status={},
+    )
+
+    today_sig = _events_signature(**kwargs, events=[event], tomorrow_events=[])
+    tomorrow_sig = _events_signature(**kwargs, events=[], tomorrow_events=[event])
+
+    assert today_sig != tomorrow_sig
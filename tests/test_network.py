@@ -0,0 +1,39 @@
+import os
+
+from inkycal.network import get_ups_status, get_wifi_status
+
+
+def test_wifi_status_follows_sysfs_interface_symlinks(tmp_path):
+    device = tmp_path / "devices" / "wlan0"
+    (device / "wireless").mkdir(parents=True)
+    (device / "carrier").write_text("1\n", encoding="utf-8")
+    net = tmp_path / "net"
+    net.mkdir()
+    os.symlink(device, net / "wlan0")
+    (net / "bonding_masters").write_text("", encoding="utf-8")
+
+    assert get_wifi_status(net) == "connected"
+
+
+def test_ups_status_reads_first_ups_supply(tmp_path):
+    battery = tmp_path / "BAT0"
+    battery.mkdir()
+    (battery / "type").write_text("Battery\n", encoding="utf-8")
+    ups = tmp_path / "ups"
+    ups.mkdir()
+    (ups / "type").write_text("UPS\n", encoding="utf-8")
+    (ups / "status").write_text("Discharging\n", encoding="utf-8")
+    (ups / "capacity").write_text("87\n", encoding="utf-8")
+    (ups / "online").write_text("0\n", encoding="utf-8")
+
+    assert get_ups_status(tmp_path) == {
+        "present": True,
+        "status": "discharging",
+        "capacity": 87,
+        "online": False,
+    }
+
+
+def test_missing_sysfs_directories_report_nothing(tmp_path):
+    assert get_wifi_status(tmp_path / "missing") == ""
+    assert get_ups_status(tmp_path / "missing")["present"] is False
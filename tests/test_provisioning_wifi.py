@@ -0,0 +1,29 @@
+import subprocess
+
+from inkycal.provisioning import wifi
+
+
+def _fake_nmcli(monkeypatch, stdout):
+    calls = []
+
+    def fake_run(cmd, timeout=45):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout, "")
+
+    monkeypatch.setattr(wifi, "_NMCLI", "/usr/bin/nmcli")
+    monkeypatch.setattr(wifi, "_run", fake_run)
+    return calls
+
+
+def test_current_ssid_returns_the_active_network_without_rescanning(monkeypatch):
+    calls = _fake_nmcli(monkeypatch, "no:Neighbor\nyes:Home Net\nno:Cafe\n")
+
+    assert wifi.current_ssid() == "Home Net"
+    assert calls[0][0] == "/usr/bin/nmcli"
+    assert calls[0][-2:] == ["--rescan", "no"]
+
+
+def test_current_ssid_is_none_when_no_network_is_active(monkeypatch):
+    _fake_nmcli(monkeypatch, "no:Neighbor\nyes:\n")
+
+    assert wifi.current_ssid() is None
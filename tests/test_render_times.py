@@ -2,7 +2,7 @@ from datetime import datetime
 from zoneinfo import ZoneInfo
 
 from inkycal.models import Event, Reminder
-from inkycal.render import render_daily_schedule
+from inkycal.render import TOMORROW_PROFILES, render_daily_schedule
 from inkycal.weather import WeatherAlert
 
 
@@ -541,3 +541,139 @@ def test_no_reminders_region_without_reminders(monkeypatch):
     )
 
     assert "Reminders" not in observed_text
+
+
+def test_fmt_time_uses_twelve_hour_clock_around_midnight_and_noon():
+    from inkycal.render import _fmt_time
+
+    assert _fmt_time(datetime(2026, 2, 5, 0, 5)) == "12:05 am"
+    assert _fmt_time(datetime(2026, 2, 5, 11, 59)) == "11:59 am"
+    assert _fmt_time(datetime(2026, 2, 5, 12, 0)) == "12:00 pm"
+    assert _fmt_time(datetime(2026, 2, 5, 23, 30)) == "11:30 pm"
+
+
+def _wrap_fixture():
+    from PIL import Image, ImageDraw
+
+    from inkycal.render import _load_font
+
+    draw = ImageDraw.Draw(Image.new("RGB", (1, 1), "white"))
+    return draw, _load_font(52)
+
+
+def test_wrap_text_puts_a_word_wider_than_the_line_on_its_own_line():
+    from inkycal.render import _wrap_text
+
+    draw, font = _wrap_fixture()
+    long_word = "Supercalifragilistic"
+    max_width = draw.textlength(long_word, font=font) / 2
+
+    lines = _wrap_text(draw, f"a {long_word} b", font, max_width, max_lines=None)
+
+    assert lines == ["a", long_word, "b"]
+
+
+def test_wrap_text_max_lines_truncates_and_none_keeps_every_line():
+    from inkycal.render import _wrap_text
+
+    draw, font = _wrap_fixture()
+    words = ["one", "two", "three", "four", "five"]
+    # Wide enough for any single word, too narrow for any two.
+    max_width = max(draw.textlength(w, font=font) for w in words)
+
+    assert _wrap_text(draw, " ".join(words), font, max_width, max_lines=None) == words
+    assert _wrap_text(draw, " ".join(words), font, max_width, max_lines=2) == ["one", "two"]
+
+
+def test_wrap_text_keeps_a_line_that_fits_exactly():
+    from inkycal.render import _wrap_text
+
+    draw, font = _wrap_fixture()
+    exact = draw.textlength("alpha beta", font=font)
+
+    assert _wrap_text(draw, "alpha beta gamma", font, exact, max_lines=None) == ["alpha beta", "gamma"]
+    assert _wrap_text(draw, "alpha beta gamma", font, exact - 1, max_lines=None)[0] == "alpha"
+
+
+def test_wrap_text_returns_no_lines_for_empty_or_blank_text():
+    from inkycal.render import _wrap_text
+
+    draw, font = _wrap_fixture()
+
+    assert _wrap_text(draw, "", font, 500, max_lines=2) == []
+    assert _wrap_text(draw, "   ", font, 500, max_lines=None) == []
+
+
+def _render_crowded_tomorrow(monkeypatch, count):
+    # Long titles wrap to two lines even at the smallest profile, so these
+    # rows never fit their profile's minimum height.
+    from datetime import timedelta
+
+    from PIL import ImageDraw
+
+    import inkycal.render as render
+
+    tz = ZoneInfo("America/Phoenix")
+    start = datetime(2026, 2, 6, 8, 0, tzinfo=tz)
+    tomorrow_events = [
+        Event(
+            source="google",
+            title=f"Item {i:02d} quarterly planning review with the extended leadership team",
+            start=start + timedelta(minutes=30 * i),
+            end=start + timedelta(minutes=30 * i + 25),
+        )
+        for i in range(count)
+    ]
+
+    drawn = []
+    original_text = ImageDraw.ImageDraw.text
+
+    def recording_text(self, xy, text, *args, **kwargs):
+        drawn.append((text, kwargs["font"].size))
+        return original_text(self, xy, text, *args, **kwargs)
+
+    wrap_sizes = []
+    original_wrap = render._wrap_text
+
+    def recording_wrap(draw, text, font, max_width, max_lines=2):
+        wrap_sizes.append(font.size)
+        return original_wrap(draw, text, font, max_width, max_lines)
+
+    monkeypatch.setattr(ImageDraw.ImageDraw, "text", recording_text)
+    monkeypatch.setattr(render, "_wrap_text", recording_wrap)
+
+    render.render_daily_schedule(
+        canvas_w=800,
+        canvas_h=1200,
+        now=datetime(2026, 2, 5, 7, 0, tzinfo=tz),
+        events=[],
+        tz=tz,
+        show_sleep_banner=False,
+        sleep_banner_text="",
+        tomorrow_events=tomorrow_events,
+    )
+    return drawn, wrap_sizes
+
+
+def test_overflowing_tomorrow_falls_back_to_smallest_profile_without_rewrapping(monkeypatch):
+    smallest = TOMORROW_PROFILES[-1]
+    drawn, wrap_sizes = _render_crowded_tomorrow(monkeypatch, 14)
+
+    title_sizes = {size for text, size in drawn if text.startswith("Item")}
+    assert title_sizes == {smallest["title"]}
+    # The smallest profile was probed and its wrap reused, not redone.
+    assert wrap_sizes.count(smallest["title"]) == 14
+    item_indexes = [i for i, (text, _) in enumerate(drawn) if text.startswith("Item")]
+    assert ("…", 38) in drawn[item_indexes[-1]:]
+
+
+def test_tomorrow_rows_render_when_every_profile_minimum_overflows(monkeypatch):
+    smallest = TOMORROW_PROFILES[-1]
+    drawn, wrap_sizes = _render_crowded_tomorrow(monkeypatch, 20)
+
+    # No profile was probed; only the fallback wrapped, once per event.
+    assert wrap_sizes == [smallest["title"]] * 20
+    item_indexes = [i for i, (text, _) in enumerate(drawn) if text.startswith("Item")]
+    assert item_indexes
+    assert {drawn[i][1] for i in item_indexes} == {smallest["title"]}
+    assert ("…", 38) in drawn[item_indexes[-1]:]
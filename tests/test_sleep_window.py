@@ -0,0 +1,28 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from inkycal.main import _is_in_sleep_window, _parse_hhmm
+
+
+def test_parse_hhmm_returns_minutes_since_midnight():
+    assert _parse_hhmm("00:00") == 0
+    assert _parse_hhmm("06:30") == 390
+    assert _parse_hhmm("21:45") == 1305
+
+
+def test_overnight_sleep_window_wraps_past_midnight():
+    tz = ZoneInfo("America/Phoenix")
+    start, end = _parse_hhmm("22:30"), _parse_hhmm("06:30")
+
+    assert _is_in_sleep_window(datetime(2026, 2, 5, 23, 0, tzinfo=tz), start, end)
+    assert _is_in_sleep_window(datetime(2026, 2, 5, 6, 29, 59, tzinfo=tz), start, end)
+    assert not _is_in_sleep_window(datetime(2026, 2, 5, 6, 30, tzinfo=tz), start, end)
+    assert not _is_in_sleep_window(datetime(2026, 2, 5, 22, 29, tzinfo=tz), start, end)
+
+
+def test_same_day_sleep_window_is_half_open():
+    tz = ZoneInfo("America/Phoenix")
+    start, end = _parse_hhmm("13:00"), _parse_hhmm("14:00")
+
+    assert _is_in_sleep_window(datetime(2026, 2, 5, 13, 0, tzinfo=tz), start, end)
+    assert not _is_in_sleep_window(datetime(2026, 2, 5, 14, 0, tzinfo=tz), start, end)
@@ -0,0 +1,27 @@
+from inkycal.travel import TravelEstimate, TravelTimeResolver
+
+
+def test_cache_snapshot_round_trips_successful_lookups_only(monkeypatch):
+    resolver = TravelTimeResolver()
+    resolver._geocode_cache["home"] = (33.4, -112.3)
+    resolver._geocode_cache["nowhere"] = None
+    resolver._duration_cache[("home", "office")] = TravelEstimate(minutes=18, text="18 min")
+    resolver._duration_cache[("home", "nowhere")] = None
+
+    snapshot = resolver.cache_snapshot()
+    seeded = TravelTimeResolver(cache=snapshot)
+    monkeypatch.setattr(
+        seeded._session,
+        "get",
+        lambda *a, **k: (_ for _ in ()).throw(AssertionError("network should not be used")),
+    )
+
+    assert seeded.estimate("Home", "Office") == TravelEstimate(minutes=18, text="18 min")
+    assert "nowhere" not in snapshot["geocode"]
+    assert len(snapshot["durations"]) == 1
+
+
+def test_malformed_cache_starts_cold():
+    resolver = TravelTimeResolver(cache={"geocode": {"home": "not-a-pair"}, "durations": []})
+
+    assert resolver.cache_snapshot() == {"geocode": {}, "durations": {}}
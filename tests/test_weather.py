@@ -21,7 +21,7 @@ class StubWeatherResolver:
         return Forecast()
 
 
-def test_apply_weather_forecast_adds_icon_and_temperature(monkeypatch):
+def test_apply_weather_forecast_adds_icon_and_temperature():
     tz = ZoneInfo("America/Phoenix")
     event = Event(
         source="google",
@@ -30,15 +30,13 @@ def test_apply_weather_forecast_adds_icon_and_temperature(monkeypatch):
         end=datetime(2026, 2, 5, 10, 0, tzinfo=tz),
     )
 
-    monkeypatch.setattr("inkycal.main.WeatherForecastResolver", StubWeatherResolver)
-
-    processed = _apply_weather_forecast([event], "America/Phoenix", 33.4353, -112.3582)
+    processed = _apply_weather_forecast([event], StubWeatherResolver("America/Phoenix", 33.4353, -112.3582))
 
     assert processed[0].weather_icon == "☔"
     assert processed[0].weather_text == "72°F"
 
 
-def test_apply_weather_forecast_adds_start_and_end_weather_for_long_events(monkeypatch):
+def test_apply_weather_forecast_adds_start_and_end_weather_for_long_events():
     tz = ZoneInfo("America/Phoenix")
     event = Event(
         source="google",
@@ -53,9 +51,7 @@ def test_apply_weather_forecast_adds_start_and_end_weather_for_long_events(monke
                 return SimpleNamespace(temperature_f=68, icon="☁")
             return SimpleNamespace(temperature_f=72, icon="☀")
 
-    monkeypatch.setattr("inkycal.main.WeatherForecastResolver", LongEventResolver)
-
-    processed = _apply_weather_forecast([event], "America/Phoenix", 33.4353, -112.3582)
+    processed = _apply_weather_forecast([event], LongEventResolver("America/Phoenix", 33.4353, -112.3582))
 
     assert processed[0].weather_icon == "☔"
     assert processed[0].weather_text == "72°F"
@@ -169,7 +165,7 @@ def test_long_events_weather_report_filters_and_prints(monkeypatch, capsys):
     assert "end weather:   68°F ☁" in out
 
 
-def test_apply_weather_forecast_skips_end_weather_when_disabled(monkeypatch):
+def test_apply_weather_forecast_skips_end_weather_when_disabled():
     tz = ZoneInfo("America/Phoenix")
     event = Event(
         source="google",
@@ -182,13 +178,9 @@ def test_apply_weather_forecast_skips_end_weather_when_disabled(monkeypatch):
         def forecast_for_datetime(self, when):
             return SimpleNamespace(temperature_f=65, icon="☁")
 
-    monkeypatch.setattr("inkycal.main.WeatherForecastResolver", LongEventResolver)
-
     processed = _apply_weather_forecast(
         [event],
-        "America/Phoenix",
-        33.4353,
-        -112.3582,
+        LongEventResolver("America/Phoenix", 33.4353, -112.3582),
         include_end_weather_for_long_events=False,
     )
 
@@ -222,3 +214,71 @@ def test_active_alerts_uses_headline_and_dedupes(monkeypatch):
     alerts = resolver.active_alerts(limit=3)
 
     assert [alert.headline for alert in alerts] == ["Flood Warning", "Moderate: Heat Advisory"]
+
+
+def test_forecast_lookups_share_one_download(monkeypatch):
+    tz = ZoneInfo("America/Phoenix")
+    resolver = WeatherForecastResolver("America/Phoenix", 33.4, -112.3)
+    calls = []
+
+    class DummyResp:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+        def read(self):
+            return (
+                b'{"hourly": {"time": ["2026-02-05T09:00", "2026-02-05T10:00"],'
+                b' "temperature_2m": [70.4, 73.6], "weather_code": [0, 61]}}'
+            )
+
+    def fake_urlopen(*args, **kwargs):
+        calls.append(args)
+        return DummyResp()
+
+    monkeypatch.setattr("inkycal.weather.urlopen", fake_urlopen)
+
+    first = resolver.forecast_for_datetime(datetime(2026, 2, 5, 9, 15, tzinfo=tz))
+    second = resolver.forecast_for_datetime(datetime(2026, 2, 5, 10, 45, tzinfo=tz))
+    missing = resolver.forecast_for_datetime(datetime(2026, 2, 5, 11, 0, tzinfo=tz))
+
+    assert (first.temperature_f, first.icon) == (70, "☀")
+    assert (second.temperature_f, second.icon) == (74, "☔")
+    assert missing is None
+    assert len(calls) == 1
+
+
+def test_forecast_cache_snapshot_seeds_a_later_resolver(monkeypatch):
+    tz = ZoneInfo("America/Phoenix")
+    resolver = WeatherForecastResolver("America/Phoenix", 33.4, -112.3)
+    resolver._by_hour = {"2026-02-05T09:00": (70.4, 0)}
+    resolver._fetched_at = datetime.now().astimezone()
+
+    snapshot = resolver.cache_snapshot()
+    seeded = WeatherForecastResolver("America/Phoenix", 33.4, -112.3, cache=snapshot)
+    monkeypatch.setattr(
+        "inkycal.weather.urlopen",
+        lambda *a, **k: (_ for _ in ()).throw(AssertionError("network should not be used")),
+    )
+
+    forecast = seeded.forecast_for_datetime(datetime(2026, 2, 5, 9, 0, tzinfo=tz))
+    assert (forecast.temperature_f, forecast.icon) == (70, "☀")
+
+
+def test_forecast_cache_is_ignored_when_stale_or_for_another_location():
+    snapshot = {
+        "key": "33.4,-112.3,America/Phoenix",
+        "fetched_at": "2020-01-01T00:00:00+00:00",
+        "hourly": {"2020-01-01T00:00": [70.0, 0]},
+    }
+
+    stale = WeatherForecastResolver("America/Phoenix", 33.4, -112.3, cache=snapshot)
+    elsewhere = WeatherForecastResolver(
+        "America/Phoenix", 40.0, -105.0,
+        cache=dict(snapshot, fetched_at=datetime.now().astimezone().isoformat()),
+    )
+
+    assert stale.cache_snapshot() == {}
+    assert elsewhere.cache_snapshot() == {}